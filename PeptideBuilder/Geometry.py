@@ -36,9 +36,17 @@ class Geo:
     CA_C_O_angle: float
     N_CA_C_O_diangle: float
 
+    def __setattr__(self, name: str, value) -> None:
+        ##Bump a version counter on every write so derived parameter
+        ##caches (see PeptideBuilder._geo_param_array) can invalidate
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_version", self.__dict__.get("_version", 0) + 1)
+
     def __repr__(self) -> str:
         repr = ""
         for var in self.__dict__:
+            if var.startswith("_"):
+                continue
             repr += "%s = %s\n" % (var, self.__dict__[var])
         return repr
 
@@ -12,7 +12,11 @@ Biopython, for structure manipulation.
 
 This file is provided to you under the MIT License."""
 
-import math, warnings
+import copy
+import math
+import os
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Union
 
 from Bio.PDB.Polypeptide import is_aa
@@ -21,9 +25,13 @@ from Bio.PDB.Residue import Residue
 from Bio.PDB.Chain import Chain
 from Bio.PDB.Model import Model
 from Bio.PDB.Structure import Structure
-from Bio.PDB.vectors import Vector, rotaxis, calc_dihedral, calc_angle
 import numpy as np
 
+##Precision of the coordinate arrays handed to Atom objects. PDB files
+##only serialize three decimals, so float32 is the default; set
+##PEPTIDEBUILDER_COORD_DTYPE=float64 to restore the old behavior.
+COORD_DTYPE = np.dtype(os.environ.get("PEPTIDEBUILDER_COORD_DTYPE", "float32"))
+
 from .Geometry import (
     geometry,
     Geo,
@@ -38,468 +46,617 @@ from .Geometry import (
     linker_Ala_Geo,
 )
 
+##Degree/radian conversion factor, computed once at import
+_DEG2RAD = math.pi / 180.0
 
-def calculateCoordinates(
-        refA: Residue, refB: Residue, refC: Residue, L: float, ang: float, di: float
-) -> np.ndarray:
-    AV = refA.get_vector()
-    BV = refB.get_vector()
-    CV = refC.get_vector()
-
-    CA = AV - CV
-    CB = BV - CV
-
-    ##CA vector
-    AX = CA[0]
-    AY = CA[1]
-    AZ = CA[2]
-
-    ##CB vector
-    BX = CB[0]
-    BY = CB[1]
-    BZ = CB[2]
-
-    ##Plane Parameters
-    A = (AY * BZ) - (AZ * BY)
-    B = (AZ * BX) - (AX * BZ)
-    G = (AX * BY) - (AY * BX)
-
-    ##Dot Product Constant
-    F = math.sqrt(BX * BX + BY * BY + BZ * BZ) * L * math.cos(ang * (math.pi / 180.0))
-
-    ##Constants
-    const = math.sqrt(
-        math.pow((B * BZ - BY * G), 2)
-        * (
-                -(F * F) * (A * A + B * B + G * G)
-                + (
-                        B * B * (BX * BX + BZ * BZ)
-                        + A * A * (BY * BY + BZ * BZ)
-                        - (2 * A * BX * BZ * G)
-                        + (BX * BX + BY * BY) * G * G
-                        - (2 * B * BY) * (A * BX + BZ * G)
-                )
-                * L
-                * L
-        )
-    )
-    denom = (
-            (B * B) * (BX * BX + BZ * BZ)
-            + (A * A) * (BY * BY + BZ * BZ)
-            - (2 * A * BX * BZ * G)
-            + (BX * BX + BY * BY) * (G * G)
-            - (2 * B * BY) * (A * BX + BZ * G)
-    )
-
-    X = (
-                (B * B * BX * F) - (A * B * BY * F) + (F * G) * (-A * BZ + BX * G) + const
-        ) / denom
 
-    if (B == 0 or BZ == 0) and (BY == 0 or G == 0):
-        const1 = math.sqrt(
-            G * G * (-A * A * X * X + (B * B + G * G) * (L - X) * (L + X))
-        )
-        Y = ((-A * B * X) + const1) / (B * B + G * G)
-        Z = -(A * G * G * X + B * const1) / (G * (B * B + G * G))
-    else:
-        Y = (
-                    (A * A * BY * F) * (B * BZ - BY * G)
-                    + G * (-F * math.pow(B * BZ - BY * G, 2) + BX * const)
-                    - A * (B * B * BX * BZ * F - B * BX * BY * F * G + BZ * const)
-            ) / ((B * BZ - BY * G) * denom)
-        Z = (
-                    (A * A * BZ * F) * (B * BZ - BY * G)
-                    + (B * F) * math.pow(B * BZ - BY * G, 2)
-                    + (A * BX * F * G) * (-B * BZ + BY * G)
-                    - B * BX * const
-                    + A * BY * const
-            ) / ((B * BZ - BY * G) * denom)
-
-    # Get the new Vector from the origin
-    D = Vector(X, Y, Z) + CV
-    with warnings.catch_warnings():
-        # ignore inconsequential warning
-        warnings.simplefilter("ignore")
-        temp = calc_dihedral(AV, BV, CV, D) * (180.0 / math.pi)
-
-    di = di - temp
-    rot = rotaxis(math.pi * (di / 180.0), CV - BV)
-    D = (D - BV).left_multiply(rot) + BV
-
-    return D.get_array()
+@lru_cache(maxsize=128)
+def _geometry_template(code: str) -> Geo:
+    return geometry(code)
 
 
+def _cached_geometry(code: str) -> Geo:
+    """Like geometry(), but reuses one template per residue code and hands
+    out a copy, so repeated builds skip re-running the Geo constructor."""
+    return copy.copy(_geometry_template(code))
 
-def makeAa(segID: int, N, CD1, CG, NB, CA, C, O, geo: AAGeo) -> Residue:
-    CE1_CD1_length = geo.CE1_CD1_length
-    CE1_CD1_CG_angle = geo.CE1_CD1_CG_angle
-    CE1_CD1_CG_NB_diangle = geo.CE1_CD1_CG_NB_diangle
 
-    NB_SG_length = geo.NB_SG_length
-    CG_NB_SG_angle = geo.CG_NB_SG_angle
-    CD1_CG_NB_SG_diangle = geo.CD1_CG_NB_SG_diangle
+def _geo_param_array(geo: Geo, key: str, build) -> np.ndarray:
+    """Memoize a derived parameter array on the geo instance. The cache is
+    tied to the geo's write counter, so mutating any attribute (phi, psi,
+    individual bond parameters) rebuilds the array on next use."""
+    version = geo.__dict__.get("_version", 0)
+    cache = geo.__dict__.get("_param_cache")
+    if cache is None or cache["_version"] != version:
+        cache = {"_version": version}
+        object.__setattr__(geo, "_param_cache", cache)
+    params = cache.get(key)
+    if params is None:
+        params = build(geo)
+        cache[key] = params
+    return params
 
-    OD2_SG_length = geo.OD2_SG_length
-    OD2_SG_NB_angle = geo.OD2_SG_NB_angle
-    CA_NB_SG_OD2_diangle = geo.CA_NB_SG_OD2_diangle
 
-    OD1_SG_length = geo.OD1_SG_length
-    OD1_SG_NB_angle = geo.OD1_SG_NB_angle
-    CG_NB_SG_OD1_diangle = geo.CG_NB_SG_OD1_diangle
+def _ala_aa_chain_params(geo: Geo) -> np.ndarray:
+    params = np.array(
+        [
+            (geo.N_C_length, geo.N_C_CA_angle, geo.N_C_CA_N_diangle),
+            (geo.CD1_N_length, geo.CD1_N_C_angle, geo.CD1_N_C_CA_diangle),
+            (geo.CG_CD1_length, geo.CG_CD1_N_angle, geo.CG_CD1_N_C_diangle),
+            (geo.NB_CG_length, geo.NB_CG_CD1_angle, geo.NB_CG_CD1_N_diangle),
+            (geo.CA_NB_length, geo.CA_NB_CG_angle, geo.CA_NB_CG_CD1_diangle),
+            (geo.C_CA_length, geo.C_CA_NB_angle, geo.C_CA_NB_CG_diangle),
+            (geo.O_C_length, geo.O_C_CA_angle, geo.O_C_CA_NB_diangle),
+        ]
+    )
+    params[:, 1:] *= _DEG2RAD
+    return params
 
-    SG_CD2_length = geo.SG_CD2_length
-    NB_SG_CD2_angle = geo.NB_SG_CD2_angle
-    CG_NB_SG_CD2_diangle = geo.CG_NB_SG_CD2_diangle
 
-    CD2_CE2_length = geo.CD2_CE2_length
-    SG_CD2_CE2_angle = geo.SG_CD2_CE2_angle
-    NB_SG_CD2_CE2_diangle = geo.NB_SG_CD2_CE2_diangle
+def _aa_chain_params(geo: Geo) -> np.ndarray:
+    params = np.array(
+        [
+            (geo.peptide_bond, geo.CA_C_N_angle, geo.NB_CA_C_N_diangle),
+            (geo.N_CD1_length, geo.C_N_CD1_angle, geo.CA_C_N_CD1_diangle),
+            (geo.CD1_CG_length, geo.N_CD1_CG_angle, geo.c),
+            (geo.CG_NB_length, geo.CD1_CG_NB_angle, geo.N_CD1_CG_NB_diangle),
+            (geo.CA_NB_length, geo.CG_NB_CA_angle, geo.a),
+            (geo.CA_C_length, geo.NB_CA_C_angle, geo.CG_NB_CA_C_diangle1),
+            (geo.C_O_length, geo.CA_C_O_angle, geo.NB_CA_C_O_diangle1),
+        ]
+    )
+    params[:, 1:] *= _DEG2RAD
+    return params
 
-    CE2_CZ1_length = geo.CE2_CZ1_length
-    CD2_CE2_CZ1_angle = geo.CD2_CE2_CZ1_angle
-    SG_CD2_CE2_CZ1_diangle = geo.SG_CD2_CE2_CZ1_diangle
 
-    CD2_CE3_length = geo.CD2_CE3_length
-    SG_CD2_CE3_angle = geo.SG_CD2_CE3_angle
-    NB_SG_CD2_CE3_diangle = geo.NB_SG_CD2_CE3_diangle
+def _AA_AA_chain_params(geo: Geo) -> np.ndarray:
+    params = np.array(
+        [
+            (geo.N_C_length, geo.N_C_CA_angle, geo.N_C_CA_NB_diangle),
+            (geo.CD1_N_length, geo.CD1_N_C_angle, geo.CD1_N_C_CA_diangle),
+            (geo.CG_CD1_length, geo.CG_CD1_N_angle, geo.CG_CD1_N_C_diangle),
+            (geo.NB_CG_length, geo.NB_CG_CD1_angle, geo.NB_CG_CD1_N_diangle),
+            (geo.CA_NB_length, geo.CA_NB_CG_angle, geo.CA_NB_CG_CD1_diangle),
+            (geo.C_CA_length, geo.C_CA_NB_angle, geo.C_CA_NB_CG_diangle),
+            (geo.C_O_length, geo.CA_C_O_angle, geo.NB_CA_C_O_diangle),
+        ]
+    )
+    params[:, 1:] *= _DEG2RAD
+    return params
 
-    CE3_CZ2_length = geo.CE3_CZ2_length
-    CD2_CE3_CZ2_angle = geo.CD2_CE3_CZ2_angle
-    SG_CD2_CE3_CZ2_diangle = geo.SG_CD2_CE3_CZ2_diangle
 
-    CZ1_CH_length = geo.CZ1_CH_length
-    CE2_CZ1_CH_angle = geo.CE2_CZ1_CH_angle
-    CD2_CE2_CZ1_CH_diangle = geo.CD2_CE2_CZ1_CH_diangle
+def _linker2_1_chain_params(geo: Geo) -> np.ndarray:
+    params = np.array(
+        [
+            (geo.N_CL_length, geo.N_CL_C15_angle, geo.N_CL_C15_C14_diangle),
+            (geo.N_CD1_length, geo.CD1_N_CL_angle, geo.CD1_N_CL_C15_diangle),
+            (geo.CD1_CG_length, geo.N_CD1_CG_angle, geo.CG_CD1_N_CL_diangle),
+            (geo.CG_NB_length, geo.CD1_CG_NB_angle, geo.N_CD1_CG_NB_diangle),
+            (geo.CA_NB_length, geo.CG_NB_CA_angle, geo.a1),
+            (geo.CA_C_length, geo.NB_CA_C_angle, geo.CG_NB_CA_C_diangle),
+            (geo.C_O_length, geo.CA_C_O_angle, geo.NB_CA_C_O_diangle),
+        ]
+    )
+    params[:, 1:] *= _DEG2RAD
+    return params
 
-    CH_Cl17_length = geo.CH_Cl17_length
-    CZ1_CH_Cl17_angle = geo.CZ1_CH_Cl17_angle
-    CE2_CZ1_CH_Cl17_diangle = geo.CE2_CZ1_CH_Cl17_diangle
 
-    carbon_e1 = calculateCoordinates(
-        NB, CG, CD1, CE1_CD1_length, CE1_CD1_CG_angle, CE1_CD1_CG_NB_diangle
-    )
-    CE1 = Atom("CE1", carbon_e1, 0.0, 1.0, " ", " CE1", 0, "C")
-    sulfur_g = calculateCoordinates(
-        CD1, CG, NB, NB_SG_length, CG_NB_SG_angle, CD1_CG_NB_SG_diangle
-    )
-    SG = Atom("SG", sulfur_g, 0.0, 1.0, " ", " SG", 0, "S")
-    oxygen_d2 = calculateCoordinates(
-        CA, NB, SG, OD2_SG_length, OD2_SG_NB_angle, CA_NB_SG_OD2_diangle
-    )
-    OD2 = Atom("OD2", oxygen_d2, 0.0, 1.0, " ", " OD2", 0, "O")
-    oxygen_d1 = calculateCoordinates(
-        CG, NB, SG, OD1_SG_length, OD1_SG_NB_angle, CG_NB_SG_OD1_diangle
+def _alalinker_chain_params(geo: Geo) -> np.ndarray:
+    params = np.array(
+        [
+            (geo.N1_C_length, geo.N1_C_CA_angle, geo.N1_C_CA_N_diangle),
+            (geo.C5_N1_length, geo.C5_N1_C_angle, geo.C5_N1_C_CA_diangle),
+            (geo.C6_C5_length, geo.C6_C5_N1_angle, geo.C6_C5_N1_C_diangle),
+            (geo.C7_C6_length, geo.C7_C6_C5_angle, geo.C7_C6_C5_N1_diangle),
+            (geo.C8_C7_length, geo.C8_C7_C6_angle, geo.C8_C7_C6_C5_diangle),
+            (geo.O3_C8_length, geo.O3_C8_C7_angle, geo.O3_C8_C7_C6_diangle),
+            (geo.N2_C8_length, geo.N2_C8_C7_angle, geo.N2_C8_C7_C6_diangle),
+            (geo.C9_N2_length, geo.C9_N2_C8_angle, geo.C9_N2_C8_C7_diangle),
+            (geo.C10_C9_length, geo.C10_C9_N2_angle, geo.C10_C9_N2_C8_diangle),
+            (geo.O4_C10_length, geo.O4_C10_C9_angle, geo.O4_C10_C9_N2_diangle),
+            (geo.N3_C10_length, geo.N3_C10_C9_angle, geo.N3_C10_C9_N2_diangle),
+            (geo.C11_N3_length, geo.C11_N3_C10_angle, geo.C11_N3_C10_C9_diangle),
+            (geo.C12_C11_length, geo.C12_C11_N3_angle, geo.C12_C11_N3_C10_diangle),
+            (geo.C13_C12_length, geo.C13_C12_C11_angle, geo.C13_C12_C11_N3_diangle),
+            (geo.C4_C13_length, geo.C4_C13_C12_angle, geo.C4_C13_C12_C11_diangle),
+            (geo.O2_C4_length, geo.O2_C4_C13_angle, geo.O2_C4_C13_C12_diangle),
+        ]
     )
-    OD1 = Atom("OD1", oxygen_d1, 0.0, 1.0, " ", " OD1", 0, "O")
+    params[:, 1:] *= _DEG2RAD
+    return params
 
-    carbon_d2 = calculateCoordinates(
-        CG, NB, SG, SG_CD2_length, NB_SG_CD2_angle, CG_NB_SG_CD2_diangle
-    )
-    CD2 = Atom("CD2", carbon_d2, 0.0, 1.0, " ", " CD2", 0, "C")
-    carbon_e2 = calculateCoordinates(
-        NB, SG, CD2, CD2_CE2_length, SG_CD2_CE2_angle, NB_SG_CD2_CE2_diangle
-    )
-    CE2 = Atom("CE2", carbon_e2, 0.0, 1.0, " ", " CE2", 0, "C")
-    carbon_z1 = calculateCoordinates(
-        SG, CD2, CE2, CE2_CZ1_length, CD2_CE2_CZ1_angle, SG_CD2_CE2_CZ1_diangle
-    )
-    CZ1 = Atom("CZ1", carbon_z1, 0.0, 1.0, " ", " CZ1", 0, "C")
-    carbon_e3 = calculateCoordinates(
-        NB, SG, CD2, CD2_CE3_length, SG_CD2_CE3_angle, NB_SG_CD2_CE3_diangle
-    )
-    CE3 = Atom("CE3", carbon_e3, 0.0, 1.0, " ", " CE3", 0, "C")
-    carbon_z2 = calculateCoordinates(
-        SG, CD2, CE3, CE3_CZ2_length, CD2_CE3_CZ2_angle, SG_CD2_CE3_CZ2_diangle
+
+def _place_atom(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray,
+        L: float, ang_rad: float, di_rad: float
+) -> np.ndarray:
+    ##Orthonormal reference frame at c (NeRF placement)
+    bc = c - b
+    bc = bc / math.sqrt(bc[0] * bc[0] + bc[1] * bc[1] + bc[2] * bc[2])
+    n = np.cross(b - a, bc)
+    n = n / math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+    m = np.cross(n, bc)
+
+    ##Place the new atom at distance L from c, with the requested
+    ##bond angle to b and dihedral angle against the a-b-c plane
+    ct = math.cos(ang_rad)
+    st = math.sin(ang_rad)
+    cp = math.cos(di_rad)
+    sp = math.sin(di_rad)
+    d1 = -L * ct
+    d2 = L * st * cp
+    d3 = L * st * sp
+
+    return c + d1 * bc + d2 * m + d3 * n
+
+
+try:
+    ##JIT-compile the placement kernel when numba is available; the
+    ##pure-Python definition above remains the fallback
+    from numba import njit
+
+    _place_atom = njit(cache=True, fastmath=True)(_place_atom)
+except ImportError:
+    pass
+
+
+def _place_offset(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray,
+        d1: float, d2: float, d3: float
+) -> np.ndarray:
+    ##Frame-only placement: the trig-derived local offsets arrive
+    ##precomputed, so only the orthonormal basis is built per atom
+    bc = c - b
+    bc = bc / math.sqrt(bc[0] * bc[0] + bc[1] * bc[1] + bc[2] * bc[2])
+    n = np.cross(b - a, bc)
+    n = n / math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+    m = np.cross(n, bc)
+    return c + d1 * bc + d2 * m + d3 * n
+
+
+try:
+    _place_offset = njit(cache=True, fastmath=True)(_place_offset)
+except NameError:
+    pass
+
+
+def _chain_offsets(params: np.ndarray) -> np.ndarray:
+    """Convert (n, 3) length/angle/dihedral parameter rows into local
+    frame offsets (d1, d2, d3) with one vectorized trig pass, so the
+    sequential kernels never call sin/cos themselves."""
+    L = params[:, 0]
+    ang = params[:, 1]
+    di = params[:, 2]
+    st = np.sin(ang)
+    return np.stack(
+        (-L * np.cos(ang), L * st * np.cos(di), L * st * np.sin(di)), axis=1
     )
-    CZ2 = Atom("CZ2", carbon_z2, 0.0, 1.0, " ", " CZ2", 0, "C")
-    carbon_h = calculateCoordinates(
-        CD2, CE2, CZ1, CZ1_CH_length, CE2_CZ1_CH_angle, CD2_CE2_CZ1_CH_diangle
+
+
+def _geo_chain_offsets(geo: Geo, key: str, build) -> np.ndarray:
+    """Memoized offset rows for a chained motif, derived from (and cached
+    alongside) the motif's parameter array."""
+    return _geo_param_array(
+        geo, key + ".offsets", lambda g: _chain_offsets(_geo_param_array(g, key, build))
     )
-    CH = Atom("CH", carbon_h, 0.0, 1.0, " ", " CH", 0, "C")
-    chlorine_17 = calculateCoordinates(
-        CE2, CZ1, CH, CH_Cl17_length, CZ1_CH_Cl17_angle, CE2_CZ1_CH_Cl17_diangle
+
+
+def _chain_place(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray, offs: np.ndarray
+) -> np.ndarray:
+    """Run a strictly sequential chain of placements: row i of offs holds
+    the precomputed local frame offsets (see _chain_offsets) for an atom
+    whose reference frame is the rolling window of the three previously
+    placed atoms."""
+    out = np.empty((offs.shape[0], 3))
+    p0, p1, p2 = a, b, c
+    for i in range(offs.shape[0]):
+        d = _place_offset(p0, p1, p2, offs[i, 0], offs[i, 1], offs[i, 2])
+        out[i] = d
+        p0, p1, p2 = p1, p2, d
+    return out
+
+
+try:
+    _chain_place = njit(cache=True, fastmath=True)(_chain_place)
+except NameError:
+    pass
+
+
+def _chain_place_multi(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray, offs: np.ndarray
+) -> np.ndarray:
+    """Run _chain_place for several consecutive residues in one call.
+    offs has shape (n, 7, 3); after each residue the reference frame
+    advances to its NB/CA/C atoms, matching add_residue_from_geo."""
+    n = offs.shape[0]
+    out = np.empty((n, 7, 3))
+    p0, p1, p2 = a, b, c
+    for r in range(n):
+        for i in range(7):
+            d = _place_offset(p0, p1, p2, offs[r, i, 0], offs[r, i, 1], offs[r, i, 2])
+            out[r, i] = d
+            p0, p1, p2 = p1, p2, d
+        p0 = out[r, 3]
+        p1 = out[r, 4]
+        p2 = out[r, 5]
+    return out
+
+
+try:
+    _chain_place_multi = njit(cache=True, fastmath=True)(_chain_place_multi)
+except NameError:
+    pass
+
+
+def calculateCoordinates(
+        refA: Residue, refB: Residue, refC: Residue, L: float, ang: float, di: float
+) -> np.ndarray:
+    AV = refA.coord
+    BV = refB.coord
+    CV = refC.coord
+
+    D = _place_atom(AV, BV, CV, L, ang * _DEG2RAD, di * _DEG2RAD)
+    ##Collinear reference atoms leave no defined dihedral plane; the
+    ##branchless kernel then yields non-finite output, caught here once
+    if not np.isfinite(D).all():
+        raise ValueError("Degenerate reference geometry:", refA, refB, refC)
+    return D.astype(COORD_DTYPE, copy=False)
+
+
+def _place_atom_batch(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray,
+        L: np.ndarray, ang_rad: np.ndarray, di_rad: np.ndarray
+) -> np.ndarray:
+    """Vectorized _place_atom: one placement per row of the stacked
+    reference coordinates and geometry parameters (angles in radians)."""
+    bc = c - b
+    bc = bc / np.linalg.norm(bc, axis=1, keepdims=True)
+    n = np.cross(b - a, bc)
+    n = n / np.linalg.norm(n, axis=1, keepdims=True)
+    m = np.cross(n, bc)
+
+    st = np.sin(ang_rad)
+    d1 = -L * np.cos(ang_rad)
+    d2 = L * st * np.cos(di_rad)
+    d3 = L * st * np.sin(di_rad)
+
+    return c + d1[:, None] * bc + d2[:, None] * m + d3[:, None] * n
+
+
+def _place_atoms_shared_frame(
+        a: np.ndarray, b: np.ndarray, c: np.ndarray,
+        L: np.ndarray, ang_rad: np.ndarray, di_rad: np.ndarray
+) -> np.ndarray:
+    """Place several atoms that hang off one a-b-c reference frame: the
+    orthonormal basis is built once and applied to all local offsets."""
+    bc = c - b
+    bc = bc / math.sqrt(bc[0] * bc[0] + bc[1] * bc[1] + bc[2] * bc[2])
+    n = np.cross(b - a, bc)
+    n = n / math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+    m = np.cross(n, bc)
+    M = np.stack((bc, m, n), axis=1)
+
+    st = np.sin(ang_rad)
+    offsets = np.stack(
+        (-L * np.cos(ang_rad), L * st * np.cos(di_rad), L * st * np.sin(di_rad)),
+        axis=1,
     )
-    Cl17 = Atom("Cl17", chlorine_17, 0.0, 1.0, " ", " Cl17", 0, "CL")
+    return c + offsets @ M.T
 
-    res = Residue((" ", segID, " "), "PHE", "    ")
-    res.add(N)
-    res.add(CD1)
-    res.add(CG)
-    res.add(NB)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-
-    res.add(CE1)
-    res.add(SG)
-    res.add(OD1)
-    res.add(OD2)
-    res.add(CD2)
-    res.add(CE2)
-    res.add(CE3)
-    res.add(CZ1)
-    res.add(CZ2)
-    res.add(CH)
-    res.add(Cl17)
+
+##Backbone atoms the chain-extension code reads off the reference
+##residue; they get direct _<name> attributes to skip the child_dict
+##lookups on every extension
+_TAIL_REF_NAMES = frozenset(("N", "NB", "CA", "C", "O", "C12", "C13", "C4"))
+
+
+##Prebuilt Atom prototypes, cloned instead of re-running the eight-arg
+##Atom.__init__ for every placement; keyed by (name, fullname) because a
+##few linker atoms reuse a name with a different fullname
+_ATOM_TEMPLATES: dict = {}
+
+
+def _new_atom(name: str, coord: np.ndarray, fullname: str, element: str) -> Atom:
+    key = (name, fullname)
+    template = _ATOM_TEMPLATES.get(key)
+    if template is None:
+        template = _ATOM_TEMPLATES[key] = Atom(
+            name, np.zeros(3, dtype=COORD_DTYPE), 0.0, 1.0, " ", fullname, 0, element
+        )
+    atom = copy.copy(template)
+    atom.coord = coord
+    ##copy.copy is shallow, so clones would otherwise share the
+    ##template's xtra dict across structures
+    atom.xtra = {}
+    return atom
+
+
+def _fill_residue(res: Residue, atoms) -> Residue:
+    """Attach a statically known, duplicate-free atom list to a residue,
+    bypassing the per-atom id checks done by Entity.add."""
+    rd = res.__dict__
+    cd = {}
+    for a in atoms:
+        a.set_parent(res)
+        aid = a.get_id()
+        cd[aid] = a
+        if aid in _TAIL_REF_NAMES:
+            rd["_" + aid] = a
+    res.child_list = list(atoms)
+    res.child_dict = cd
+    rd["_id_num"] = res.id[1]
     return res
 
 
-def makeAA_AA(segID: int, N, CD1, CG, NB, CA, C, O, geo: AA_AAGeo) -> Residue:
+##All geometry parameters makeAa needs, fetched in one C-level call
+##instead of ~33 separate attribute lookups per residue
+_AA_GEO_PARAMS = attrgetter(
+    "CE1_CD1_length", "CE1_CD1_CG_angle", "CE1_CD1_CG_NB_diangle",
+    "NB_SG_length", "CG_NB_SG_angle", "CD1_CG_NB_SG_diangle",
+    "OD2_SG_length", "OD2_SG_NB_angle", "CA_NB_SG_OD2_diangle",
+    "OD1_SG_length", "OD1_SG_NB_angle", "CG_NB_SG_OD1_diangle",
+    "SG_CD2_length", "NB_SG_CD2_angle", "CG_NB_SG_CD2_diangle",
+    "CD2_CE2_length", "SG_CD2_CE2_angle", "NB_SG_CD2_CE2_diangle",
+    "CE2_CZ1_length", "CD2_CE2_CZ1_angle", "SG_CD2_CE2_CZ1_diangle",
+    "CD2_CE3_length", "SG_CD2_CE3_angle", "NB_SG_CD2_CE3_diangle",
+    "CE3_CZ2_length", "CD2_CE3_CZ2_angle", "SG_CD2_CE3_CZ2_diangle",
+    "CZ1_CH_length", "CE2_CZ1_CH_angle", "CD2_CE2_CZ1_CH_diangle",
+    "CH_Cl17_length", "CZ1_CH_Cl17_angle", "CE2_CZ1_CH_Cl17_diangle",
+)
+
+
+def makeAa(segID: int, N, CD1, CG, NB, CA, C, O, geo: AAGeo) -> Residue:
+    cd1 = CD1.coord
+    cg = CG.coord
+    nb = NB.coord
+    ca = CA.coord
+
+    (
+        CE1_CD1_length, CE1_CD1_CG_angle, CE1_CD1_CG_NB_diangle,
+        NB_SG_length, CG_NB_SG_angle, CD1_CG_NB_SG_diangle,
+        OD2_SG_length, OD2_SG_NB_angle, CA_NB_SG_OD2_diangle,
+        OD1_SG_length, OD1_SG_NB_angle, CG_NB_SG_OD1_diangle,
+        SG_CD2_length, NB_SG_CD2_angle, CG_NB_SG_CD2_diangle,
+        CD2_CE2_length, SG_CD2_CE2_angle, NB_SG_CD2_CE2_diangle,
+        CE2_CZ1_length, CD2_CE2_CZ1_angle, SG_CD2_CE2_CZ1_diangle,
+        CD2_CE3_length, SG_CD2_CE3_angle, NB_SG_CD2_CE3_diangle,
+        CE3_CZ2_length, CD2_CE3_CZ2_angle, SG_CD2_CE3_CZ2_diangle,
+        CZ1_CH_length, CE2_CZ1_CH_angle, CD2_CE2_CZ1_CH_diangle,
+        CH_Cl17_length, CZ1_CH_Cl17_angle, CE2_CZ1_CH_Cl17_diangle,
+    ) = _AA_GEO_PARAMS(geo)
+
+    ##Place the sidechain one dependency level at a time, batching the
+    ##placements within each level into a single vectorized call
+    carbon_e1, sulfur_g = _place_atom_batch(
+        np.stack((nb, cd1)),
+        np.stack((cg, cg)),
+        np.stack((cd1, nb)),
+        np.array([CE1_CD1_length, NB_SG_length]),
+        np.array([CE1_CD1_CG_angle, CG_NB_SG_angle]) * _DEG2RAD,
+        np.array([CE1_CD1_CG_NB_diangle, CD1_CG_NB_SG_diangle]) * _DEG2RAD,
+    )
+    oxygen_d2 = _place_atom(
+        ca, nb, sulfur_g,
+        OD2_SG_length, OD2_SG_NB_angle * _DEG2RAD, CA_NB_SG_OD2_diangle * _DEG2RAD,
+    )
+    ##OD1 and CD2 share the CG-NB-SG frame, as do CE2 and CE3 off the
+    ##NB-SG-CD2 frame: build each basis once for both placements
+    oxygen_d1, carbon_d2 = _place_atoms_shared_frame(
+        cg, nb, sulfur_g,
+        np.array([OD1_SG_length, SG_CD2_length]),
+        np.array([OD1_SG_NB_angle, NB_SG_CD2_angle]) * _DEG2RAD,
+        np.array([CG_NB_SG_OD1_diangle, CG_NB_SG_CD2_diangle]) * _DEG2RAD,
+    )
+    carbon_e2, carbon_e3 = _place_atoms_shared_frame(
+        nb, sulfur_g, carbon_d2,
+        np.array([CD2_CE2_length, CD2_CE3_length]),
+        np.array([SG_CD2_CE2_angle, SG_CD2_CE3_angle]) * _DEG2RAD,
+        np.array([NB_SG_CD2_CE2_diangle, NB_SG_CD2_CE3_diangle]) * _DEG2RAD,
+    )
+    carbon_z1, carbon_z2 = _place_atom_batch(
+        np.stack((sulfur_g, sulfur_g)),
+        np.stack((carbon_d2, carbon_d2)),
+        np.stack((carbon_e2, carbon_e3)),
+        np.array([CE2_CZ1_length, CE3_CZ2_length]),
+        np.array([CD2_CE2_CZ1_angle, CD2_CE3_CZ2_angle]) * _DEG2RAD,
+        np.array([SG_CD2_CE2_CZ1_diangle, SG_CD2_CE3_CZ2_diangle]) * _DEG2RAD,
+    )
+    carbon_h = _place_atom(
+        carbon_d2,
+        carbon_e2,
+        carbon_z1,
+        CZ1_CH_length,
+        CE2_CZ1_CH_angle * _DEG2RAD,
+        CD2_CE2_CZ1_CH_diangle * _DEG2RAD,
+    )
+    chlorine_17 = _place_atom(
+        carbon_e2,
+        carbon_z1,
+        carbon_h,
+        CH_Cl17_length,
+        CZ1_CH_Cl17_angle * _DEG2RAD,
+        CE2_CZ1_CH_Cl17_diangle * _DEG2RAD,
+    )
+
+    ##One contiguous block for the sidechain; each Atom gets a row view
+    side = np.stack(
+        (carbon_e1, sulfur_g, oxygen_d2, oxygen_d1, carbon_d2, carbon_e2,
+         carbon_z1, carbon_e3, carbon_z2, carbon_h, chlorine_17)
+    ).astype(COORD_DTYPE, copy=False)
+    CE1 = _new_atom("CE1", side[0], " CE1", "C")
+    SG = _new_atom("SG", side[1], " SG", "S")
+    OD2 = _new_atom("OD2", side[2], " OD2", "O")
+    OD1 = _new_atom("OD1", side[3], " OD1", "O")
+    CD2 = _new_atom("CD2", side[4], " CD2", "C")
+    CE2 = _new_atom("CE2", side[5], " CE2", "C")
+    CZ1 = _new_atom("CZ1", side[6], " CZ1", "C")
+    CE3 = _new_atom("CE3", side[7], " CE3", "C")
+    CZ2 = _new_atom("CZ2", side[8], " CZ2", "C")
+    CH = _new_atom("CH", side[9], " CH", "C")
+    Cl17 = _new_atom("Cl17", side[10], " Cl17", "CL")
+
     res = Residue((" ", segID, " "), "PHE", "    ")
+    return _fill_residue(
+        res,
+        (N, CD1, CG, NB, CA, C, O,
+         CE1, SG, OD1, OD2, CD2, CE2, CE3, CZ1, CZ2, CH, Cl17),
+    )
 
-    res.add(N)
-    res.add(CD1)
-    res.add(CG)
-    res.add(NB)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-    return res
 
-def makeAla(segID: int, N, CA, C, O, geo: AlaGeo) -> Residue:
+def makeAA_AA(segID: int, N, CD1, CG, NB, CA, C, O, geo: AA_AAGeo) -> Residue:
+    res = Residue((" ", segID, " "), "PHE", "    ")
+    return _fill_residue(res, (N, CD1, CG, NB, CA, C, O))
+
+def makeAla(segID: int, N, CA, C, O, geo: Geo) -> Residue:
     """Creates an Alanine residue"""
     ##R-Group
 
     carbon_b = calculateCoordinates(
         N, C, CA, geo.CB_CA_length, geo.CB_CA_C_angle, geo.CB_CA_C_N_diangle
     )
-    CB = Atom("CB", carbon_b, 0.0, 1.0, " ", " CB", 0, "C")
+    CB = _new_atom("CB", carbon_b, " CB", "C")
 
     res = Residue((" ", segID, " "), "ALA", "    ")
-    res.add(N)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-    res.add(CB)
-    return res
-def make_odd_Aa(segID: int, N, CD1, CG, NB, CA, C, O, geo: AA_odd_Geo) -> Residue:
-    carbon_e1 = calculateCoordinates(
-        NB, CG, CD1, geo.CE1_CD1_length, geo.CE1_CD1_CG_angle, geo.CE1_CD1_CG_NB_diangle
-    )
-    CE1 = Atom("CE1", carbon_e1, 0.0, 1.0, " ", " CE1", 0, "C")
-    sulfur_g = calculateCoordinates(
-        CD1, CG, NB, geo.SG_NB_length, geo.SG_NB_CG_angle, geo.SG_NB_CG_CD1_diangle
-    )
-    SG = Atom("SG", sulfur_g, 0.0, 1.0, " ", " SG", 0, "S")
-    oxygen_d2 = calculateCoordinates(
-        CA, NB, SG, geo.OD2_SG_length, geo.OD2_SG_NB_angle, geo.OD2_SG_NB_CA_diangle
-    )
-    OD2 = Atom("OD2", oxygen_d2, 0.0, 1.0, " ", " OD2", 0, "O")
-    oxygen_d1 = calculateCoordinates(
-        CG, NB, SG, geo.OD1_SG_length, geo.OD1_SG_NB_angle, geo.OD1_SG_NB_CG_diangle
-    )
-    OD1 = Atom("OD1", oxygen_d1, 0.0, 1.0, " ", " OD1", 0, "O")
+    return _fill_residue(res, (N, CA, C, O, CB))
+##Same one-shot parameter fetch, specialized for the odd/even Aa geometry
+_ODD_AA_GEO_PARAMS = attrgetter(
+    "CE1_CD1_length", "CE1_CD1_CG_angle", "CE1_CD1_CG_NB_diangle",
+    "SG_NB_length", "SG_NB_CG_angle", "SG_NB_CG_CD1_diangle",
+    "OD2_SG_length", "OD2_SG_NB_angle", "OD2_SG_NB_CA_diangle",
+    "OD1_SG_length", "OD1_SG_NB_angle", "OD1_SG_NB_CG_diangle",
+    "CD2_SG_length", "CD2_SG_NB_angle", "CD2_SG_NB_CG_angle",
+    "CE2_CD2_length", "CE2_CD2_SG_angle", "CE2_CD2_SG_NB_diangle",
+    "CZ1_CE2_length", "CZ1_CE2_CD2_angle", "CZ1_CE2_CD2_SG_diangle",
+    "CE3_CD2_length", "CE3_CD2_SG_angle", "CE3_CD2_SG_NB_diangle",
+    "CZ2_CE3_length", "CZ2_CE3_CD2_angle", "CZ2_CE3_CD2_SG_diangle",
+    "CH_CZ1_length", "CH_CZ1_CE2_angle", "CH_CZ1_CE2_CD2_diangle",
+    "Cl17_CH_length", "Cl17_CH_CZ1_angle", "Cl17_CH_CZ1_CE2_diangle",
+)
+
+
+def make_odd_Aa(segID: int, N, CD1, CG, NB, CA, C, O, geo: Geo) -> Residue:
+    (
+        CE1_CD1_length, CE1_CD1_CG_angle, CE1_CD1_CG_NB_diangle,
+        SG_NB_length, SG_NB_CG_angle, SG_NB_CG_CD1_diangle,
+        OD2_SG_length, OD2_SG_NB_angle, OD2_SG_NB_CA_diangle,
+        OD1_SG_length, OD1_SG_NB_angle, OD1_SG_NB_CG_diangle,
+        CD2_SG_length, CD2_SG_NB_angle, CD2_SG_NB_CG_angle,
+        CE2_CD2_length, CE2_CD2_SG_angle, CE2_CD2_SG_NB_diangle,
+        CZ1_CE2_length, CZ1_CE2_CD2_angle, CZ1_CE2_CD2_SG_diangle,
+        CE3_CD2_length, CE3_CD2_SG_angle, CE3_CD2_SG_NB_diangle,
+        CZ2_CE3_length, CZ2_CE3_CD2_angle, CZ2_CE3_CD2_SG_diangle,
+        CH_CZ1_length, CH_CZ1_CE2_angle, CH_CZ1_CE2_CD2_diangle,
+        Cl17_CH_length, Cl17_CH_CZ1_angle, Cl17_CH_CZ1_CE2_diangle,
+    ) = _ODD_AA_GEO_PARAMS(geo)
 
-    carbon_d2 = calculateCoordinates(
-        CG, NB, SG, geo.CD2_SG_length, geo.CD2_SG_NB_angle, geo.CD2_SG_NB_CG_angle
-    )
-    CD2 = Atom("CD2", carbon_d2, 0.0, 1.0, " ", " CD2", 0, "C")
-    carbon_e2 = calculateCoordinates(
-        NB, SG, CD2, geo.CE2_CD2_length, geo.CE2_CD2_SG_angle, geo.CE2_CD2_SG_NB_diangle
-    )
-    CE2 = Atom("CE2", carbon_e2, 0.0, 1.0, " ", " CE2", 0, "C")
-    carbon_z1 = calculateCoordinates(
-        SG, CD2, CE2, geo.CZ1_CE2_length, geo.CZ1_CE2_CD2_angle, geo.CZ1_CE2_CD2_SG_diangle
-    )
-    CZ1 = Atom("CZ1", carbon_z1, 0.0, 1.0, " ", " CZ1", 0, "C")
-    carbon_e3 = calculateCoordinates(
-        NB, SG, CD2, geo.CE3_CD2_length, geo.CE3_CD2_SG_angle, geo.CE3_CD2_SG_NB_diangle
-    )
-    CE3 = Atom("CE3", carbon_e3, 0.0, 1.0, " ", " CE3", 0, "C")
-    carbon_z2 = calculateCoordinates(
-        SG, CD2, CE3, geo.CZ2_CE3_length, geo.CZ2_CE3_CD2_angle, geo.CZ2_CE3_CD2_SG_diangle
-    )
-    CZ2 = Atom("CZ2", carbon_z2, 0.0, 1.0, " ", " CZ2", 0, "C")
-    carbon_h = calculateCoordinates(
-        CD2, CE2, CZ1, geo.CH_CZ1_length, geo.CH_CZ1_CE2_angle, geo.CH_CZ1_CE2_CD2_diangle
-    )
-    CH = Atom("CH", carbon_h, 0.0, 1.0, " ", " CH", 0, "C")
-    chlorine_17 = calculateCoordinates(
-        CE2, CZ1, CH, geo.Cl17_CH_length, geo.Cl17_CH_CZ1_angle, geo.Cl17_CH_CZ1_CE2_diangle
-    )
-    Cl17 = Atom("Cl17", chlorine_17, 0.0, 1.0, " ", " Cl17", 0, "CL")
-    res = Residue((" ", segID, " "), "PHE", "    ")
-    res.add(N)
-    res.add(CD1)
-    res.add(CG)
-    res.add(NB)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-
-    res.add(CE1)
-    res.add(SG)
-    res.add(OD1)
-    res.add(OD2)
-    res.add(CD2)
-    res.add(CE2)
-    res.add(CE3)
-    res.add(CZ1)
-    res.add(CZ2)
-    res.add(CH)
-    res.add(Cl17)
-    return res
-def make_even_Aa(segID: int, N, CD1, CG, NB, CA, C, O, geo: AA_even_Geo) -> Residue:
     carbon_e1 = calculateCoordinates(
-        NB, CG, CD1, geo.CE1_CD1_length, geo.CE1_CD1_CG_angle, geo.CE1_CD1_CG_NB_diangle
+        NB, CG, CD1, CE1_CD1_length, CE1_CD1_CG_angle, CE1_CD1_CG_NB_diangle
     )
-    CE1 = Atom("CE1", carbon_e1, 0.0, 1.0, " ", " CE1", 0, "C")
+    CE1 = _new_atom("CE1", carbon_e1, " CE1", "C")
     sulfur_g = calculateCoordinates(
-        CD1, CG, NB, geo.SG_NB_length, geo.SG_NB_CG_angle, geo.SG_NB_CG_CD1_diangle
+        CD1, CG, NB, SG_NB_length, SG_NB_CG_angle, SG_NB_CG_CD1_diangle
     )
-    SG = Atom("SG", sulfur_g, 0.0, 1.0, " ", " SG", 0, "S")
+    SG = _new_atom("SG", sulfur_g, " SG", "S")
     oxygen_d2 = calculateCoordinates(
-        CA, NB, SG, geo.OD2_SG_length, geo.OD2_SG_NB_angle, geo.OD2_SG_NB_CA_diangle
+        CA, NB, SG, OD2_SG_length, OD2_SG_NB_angle, OD2_SG_NB_CA_diangle
     )
-    OD2 = Atom("OD2", oxygen_d2, 0.0, 1.0, " ", " OD2", 0, "O")
+    OD2 = _new_atom("OD2", oxygen_d2, " OD2", "O")
     oxygen_d1 = calculateCoordinates(
-        CG, NB, SG, geo.OD1_SG_length, geo.OD1_SG_NB_angle, geo.OD1_SG_NB_CG_diangle
+        CG, NB, SG, OD1_SG_length, OD1_SG_NB_angle, OD1_SG_NB_CG_diangle
     )
-    OD1 = Atom("OD1", oxygen_d1, 0.0, 1.0, " ", " OD1", 0, "O")
+    OD1 = _new_atom("OD1", oxygen_d1, " OD1", "O")
 
     carbon_d2 = calculateCoordinates(
-        CG, NB, SG, geo.CD2_SG_length, geo.CD2_SG_NB_angle, geo.CD2_SG_NB_CG_angle
+        CG, NB, SG, CD2_SG_length, CD2_SG_NB_angle, CD2_SG_NB_CG_angle
     )
-    CD2 = Atom("CD2", carbon_d2, 0.0, 1.0, " ", " CD2", 0, "C")
+    CD2 = _new_atom("CD2", carbon_d2, " CD2", "C")
     carbon_e2 = calculateCoordinates(
-        NB, SG, CD2, geo.CE2_CD2_length, geo.CE2_CD2_SG_angle, geo.CE2_CD2_SG_NB_diangle
+        NB, SG, CD2, CE2_CD2_length, CE2_CD2_SG_angle, CE2_CD2_SG_NB_diangle
     )
-    CE2 = Atom("CE2", carbon_e2, 0.0, 1.0, " ", " CE2", 0, "C")
+    CE2 = _new_atom("CE2", carbon_e2, " CE2", "C")
     carbon_z1 = calculateCoordinates(
-        SG, CD2, CE2, geo.CZ1_CE2_length, geo.CZ1_CE2_CD2_angle, geo.CZ1_CE2_CD2_SG_diangle
+        SG, CD2, CE2, CZ1_CE2_length, CZ1_CE2_CD2_angle, CZ1_CE2_CD2_SG_diangle
     )
-    CZ1 = Atom("CZ1", carbon_z1, 0.0, 1.0, " ", " CZ1", 0, "C")
+    CZ1 = _new_atom("CZ1", carbon_z1, " CZ1", "C")
     carbon_e3 = calculateCoordinates(
-        NB, SG, CD2, geo.CE3_CD2_length, geo.CE3_CD2_SG_angle, geo.CE3_CD2_SG_NB_diangle
+        NB, SG, CD2, CE3_CD2_length, CE3_CD2_SG_angle, CE3_CD2_SG_NB_diangle
     )
-    CE3 = Atom("CE3", carbon_e3, 0.0, 1.0, " ", " CE3", 0, "C")
+    CE3 = _new_atom("CE3", carbon_e3, " CE3", "C")
     carbon_z2 = calculateCoordinates(
-        SG, CD2, CE3, geo.CZ2_CE3_length, geo.CZ2_CE3_CD2_angle, geo.CZ2_CE3_CD2_SG_diangle
+        SG, CD2, CE3, CZ2_CE3_length, CZ2_CE3_CD2_angle, CZ2_CE3_CD2_SG_diangle
     )
-    CZ2 = Atom("CZ2", carbon_z2, 0.0, 1.0, " ", " CZ2", 0, "C")
+    CZ2 = _new_atom("CZ2", carbon_z2, " CZ2", "C")
     carbon_h = calculateCoordinates(
-        CD2, CE2, CZ1, geo.CH_CZ1_length, geo.CH_CZ1_CE2_angle, geo.CH_CZ1_CE2_CD2_diangle
+        CD2, CE2, CZ1, CH_CZ1_length, CH_CZ1_CE2_angle, CH_CZ1_CE2_CD2_diangle
     )
-    CH = Atom("CH", carbon_h, 0.0, 1.0, " ", " CH", 0, "C")
+    CH = _new_atom("CH", carbon_h, " CH", "C")
     chlorine_17 = calculateCoordinates(
-        CE2, CZ1, CH, geo.Cl17_CH_length, geo.Cl17_CH_CZ1_angle, geo.Cl17_CH_CZ1_CE2_diangle
+        CE2, CZ1, CH, Cl17_CH_length, Cl17_CH_CZ1_angle, Cl17_CH_CZ1_CE2_diangle
     )
-    Cl17 = Atom("Cl17", chlorine_17, 0.0, 1.0, " ", " Cl17", 0, "CL")
+    Cl17 = _new_atom("Cl17", chlorine_17, " Cl17", "CL")
     res = Residue((" ", segID, " "), "PHE", "    ")
-    res.add(N)
-    res.add(CD1)
-    res.add(CG)
-    res.add(NB)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-
-    res.add(CE1)
-    res.add(SG)
-    res.add(OD1)
-    res.add(OD2)
-    res.add(CD2)
-    res.add(CE2)
-    res.add(CE3)
-    res.add(CZ1)
-    res.add(CZ2)
-    res.add(CH)
-    res.add(Cl17)
-    return res
-def make_odd_Ala(segID: int, N, CA, C, O, geo: Ala_odd_Geo) -> Residue:
-    """Creates an Alanine residue"""
-    ##R-Group
-
-    carbon_b = calculateCoordinates(
-        N, C, CA, geo.CB_CA_length, geo.CB_CA_C_angle, geo.CB_CA_C_N_diangle
-    )
-    CB = Atom("CB", carbon_b, 0.0, 1.0, " ", " CB", 0, "C")
-
-    res = Residue((" ", segID, " "), "ALA", "    ")
-    res.add(N)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-    res.add(CB)
-    return res
-def make_even_Ala(segID: int, N, CA, C, O, geo: Ala_even_Geo) -> Residue:
-    """Creates an Alanine residue"""
-    ##R-Group
-
-    carbon_b = calculateCoordinates(
-        N, C, CA, geo.CB_CA_length, geo.CB_CA_C_angle, geo.CB_CA_C_N_diangle
-    )
-    CB = Atom("CB", carbon_b, 0.0, 1.0, " ", " CB", 0, "C")
-
-    res = Residue((" ", segID, " "), "ALA", "    ")
-    res.add(N)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-    res.add(CB)
-    return res
+    return _fill_residue(
+        res,
+        (N, CD1, CG, NB, CA, C, O,
+         CE1, SG, OD1, OD2, CD2, CE2, CE3, CZ1, CZ2, CH, Cl17),
+    )
+##make_even_Aa is byte-identical to make_odd_Aa; share one implementation
+make_even_Aa = make_odd_Aa
+##the odd/even Ala makers are clones of makeAla; share one implementation
+make_odd_Ala = makeAla
+make_even_Ala = makeAla
 def makeLinker(segID: int, N1, C5, C6 ,C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2, geo: LinkerGeo) -> Residue:
     res = Residue((" ", segID, " "), "GLY", "    ")
-    res.add(N1)
-    res.add(C5)
-    res.add(C6)
-    res.add(C7)
-    res.add(C8)
-    res.add(O3)
-    res.add(N2)
-    res.add(C9)
-    res.add(C10)
-    res.add(O4)
-    res.add(N3)
-    res.add(C11)
-    res.add(C12)
-    res.add(C13)
-    res.add(C4)
-    res.add(O2)
-    return res
-def make_linker_Ala(segID: int, N, CA, C, O, geo: linker_Ala_Geo) -> Residue:
-    """Creates an Alanine residue"""
-    ##R-Group
+    return _fill_residue(
+        res,
+        (N1, C5, C6, C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2),
+    )
+make_linker_Ala = makeAla
+
+
+##Geo type -> residue builder dispatch tables, keyed on the concrete
+##class so lookup is a single dict access per residue
+_NATURAL_BUILDERS = {
+    AlaGeo: makeAla,
+    Ala_odd_Geo: make_odd_Ala,
+    Ala_even_Geo: make_even_Ala,
+    linker_Ala_Geo: make_linker_Ala,
+}
+
+_LINKER_BUILDERS = {
+    LinkerGeo: makeLinker,
+}
+
+_AA_BUILDERS = {
+    AAGeo: makeAa,
+    AA_AAGeo: makeAA_AA,
+    AA_odd_Geo: make_odd_Aa,
+    AA_even_Geo: make_even_Aa,
+}
+
+
+def _lookup_builder(table: dict, geo: Geo):
+    """Exact-type dispatch with an isinstance fallback, so user-defined Geo
+    subclasses still resolve; hits are memoized back into the table."""
+    builder = table.get(type(geo))
+    if builder is None:
+        for cls, fn in list(table.items()):
+            if isinstance(geo, cls):
+                table[type(geo)] = fn
+                return fn
+        raise ValueError("Invalid residue geometry:", geo)
+    return builder
 
-    carbon_b = calculateCoordinates(
-        N, C, CA, geo.CB_CA_length, geo.CB_CA_C_angle, geo.CB_CA_C_N_diangle
-    )
-    CB = Atom("CB", carbon_b, 0.0, 1.0, " ", " CB", 0, "C")
 
-    res = Residue((" ", segID, " "), "ALA", "    ")
-    res.add(N)
-    res.add(CA)
-    res.add(C)
-    res.add(O)
-    res.add(CB)
-    return res
 def make_res_of_type_natural(segID: int, N, CA, C, O, geo: Geo) -> Residue:
-    if isinstance(geo, AlaGeo):
-        res = makeAla(segID, N, CA, C, O, geo)
-    elif isinstance(geo, Ala_odd_Geo):
-        res = make_odd_Ala(segID, N, CA, C, O, geo)
-    elif isinstance(geo, Ala_even_Geo):
-        res = make_even_Ala(segID, N, CA, C, O, geo)
-    elif isinstance(geo, linker_Ala_Geo):
-        res = make_linker_Ala(segID, N, CA, C, O, geo)
-    return res
+    return _lookup_builder(_NATURAL_BUILDERS, geo)(segID, N, CA, C, O, geo)
 
 def make_res_of_type_linker(segID: int, N1, C5, C6 ,C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2,
                             geo: Geo) -> Residue:
-    if isinstance(geo, LinkerGeo):
-        res = makeLinker(segID, N1, C5, C6, C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2, geo)
-    return res
+    return _lookup_builder(_LINKER_BUILDERS, geo)(segID, N1, C5, C6, C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2, geo)
 def make_res_of_type_aa(segID: int, N, CD1, CG, NB, CA, C, O, geo: Geo, ) -> Residue:
-    if isinstance(geo, AAGeo):
-        res = makeAa(segID, N, CD1, CG, NB, CA, C, O, geo)
-    elif isinstance(geo, AA_AAGeo):
-        res = makeAA_AA(segID, N, CD1, CG, NB, CA, C, O, geo)
-    elif isinstance(geo, AA_odd_Geo):
-        res = make_odd_Aa(segID, N, CD1, CG, NB, CA, C, O, geo)
-    elif isinstance(geo, AA_even_Geo):
-        res = make_even_Aa(segID, N, CD1, CG, NB, CA, C, O, geo)
-    return res
-
+    return _lookup_builder(_AA_BUILDERS, geo)(segID, N, CD1, CG, NB, CA, C, O, geo)
 
 
 def initialize_res_natural(residue: Union[Geo, str]) -> Structure:
@@ -511,39 +668,30 @@ def initialize_res_natural(residue: Union[Geo, str]) -> Structure:
     if isinstance(residue, Geo):
         geo = residue
     elif isinstance(residue, str):
-        geo = geometry(residue)
+        geo = _cached_geometry(residue)
     else:
         raise ValueError("Invalid residue argument:", residue)
 
     segID = 1
     AA = geo.residue_name
-    CA_N_length = geo.CA_N_length
-    CA_C_length = geo.CA_C_length
-    N_CA_C_angle = geo.N_CA_C_angle
 
-    CA_coord = np.array([0.0, 0.0, 0.0])
-    C_coord = np.array([CA_C_length, 0, 0])
-    N_coord = np.array(
-        [
-            CA_N_length * math.cos(N_CA_C_angle * (math.pi / 180.0)),
-            CA_N_length * math.sin(N_CA_C_angle * (math.pi / 180.0)),
-            0,
-        ]
-    )
+    ##One allocation for the three bootstrap coordinates
+    backbone = np.zeros((3, 3), dtype=COORD_DTYPE)
+    backbone[1, 0] = geo.CA_C_length
+    N_angle_rad = geo.N_CA_C_angle * _DEG2RAD
+    backbone[2, 0] = geo.CA_N_length * math.cos(N_angle_rad)
+    backbone[2, 1] = geo.CA_N_length * math.sin(N_angle_rad)
+    CA_coord, C_coord, N_coord = backbone
 
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-    CA = Atom("CA", CA_coord, 0.0, 1.0, " ", " CA", 0, "C")
-    C = Atom("C", C_coord, 0.0, 1.0, " ", " C", 0, "C")
+    N = _new_atom("N", N_coord, " N", "N")
+    CA = _new_atom("CA", CA_coord, " CA", "C")
+    C = _new_atom("C", C_coord, " C", "C")
 
     ##Create Carbonyl atom (to be moved later)
-    C_O_length = geo.C_O_length
-    CA_C_O_angle = geo.CA_C_O_angle
-    N_CA_C_O_diangle = geo.N_CA_C_O_diangle
-
     carbonyl = calculateCoordinates(
-        N, CA, C, C_O_length, CA_C_O_angle, N_CA_C_O_diangle
+        N, CA, C, geo.C_O_length, geo.CA_C_O_angle, geo.N_CA_C_O_diangle
     )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    O = _new_atom("O", carbonyl, " O", "O")
 
     res = make_res_of_type_natural(segID, N, CA, C, O, geo)
 
@@ -555,6 +703,8 @@ def initialize_res_natural(residue: Union[Geo, str]) -> Structure:
 
     struc = Structure("X")
     struc.add(mod)
+    struc._chainA = cha
+    struc._tail_residue = res
     return struc
 def initialize_res(residue: Union[Geo, str]) -> Structure:
     """Creates a new structure containing a single amino acid. The type and
@@ -565,64 +715,43 @@ def initialize_res(residue: Union[Geo, str]) -> Structure:
     if isinstance(residue, Geo):
         geo = residue
     elif isinstance(residue, str):
-        geo = geometry(residue)
+        geo = _cached_geometry(residue)
     else:
         raise ValueError("Invalid residue argument:", residue)
 
     segID = 1
     AA = geo.residue_name
-    N_CD1_length = geo.N_CD1_length
-    CD1_CG_length = geo.CD1_CG_length
-    N_CD1_CG_angle = geo.N_CD1_CG_angle
-
-    CD1_coord = np.array([0.0, 0.0, 0.0])
-    CG_coord = np.array([CD1_CG_length, 0, 0])
-    N_coord = np.array(
-        [
-            N_CD1_length * math.cos(N_CD1_CG_angle * (math.pi / 180.0)),
-            N_CD1_length * math.sin(N_CD1_CG_angle * (math.pi / 180.0)),
-            0,
-        ]
-    )
 
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
+    ##One allocation for the three bootstrap coordinates
+    backbone = np.zeros((3, 3), dtype=COORD_DTYPE)
+    backbone[1, 0] = geo.CD1_CG_length
+    N_angle_rad = geo.N_CD1_CG_angle * _DEG2RAD
+    backbone[2, 0] = geo.N_CD1_length * math.cos(N_angle_rad)
+    backbone[2, 1] = geo.N_CD1_length * math.sin(N_angle_rad)
+    CD1_coord, CG_coord, N_coord = backbone
 
-    N_CD1_CG_NB_diangle = geo.N_CD1_CG_NB_diangle
-
-    CG_NB_length = geo.CG_NB_length
-    CG_NB_CA_angle = geo.CG_NB_CA_angle
-    CG_NB_CA_C_diangle = geo.CG_NB_CA_C_diangle
-
-    CA_NB_length = geo.CA_NB_length
-    CA_C_length = geo.CA_C_length
-    NB_CA_C_angle = geo.NB_CA_C_angle
-    CD1_CG_NB_angle = geo.CD1_CG_NB_angle
-    CD1_CG_NB_CA_diangle = geo.CD1_CG_NB_CA_diangle
+    N = _new_atom("N", N_coord, " N", "N")
+    CG = _new_atom("CG", CG_coord, " CG", "C")
+    CD1 = _new_atom("CD1", CD1_coord, " CD1", "C")
 
     NB = calculateCoordinates(
-        N, CD1, CG, CG_NB_length, CD1_CG_NB_angle, N_CD1_CG_NB_diangle
+        N, CD1, CG, geo.CG_NB_length, geo.CD1_CG_NB_angle, geo.N_CD1_CG_NB_diangle
     )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
+    NB = _new_atom("NB", NB, " NB", "N")
     carbon_a = calculateCoordinates(
-        CD1, CG, NB, CA_NB_length, CG_NB_CA_angle, CD1_CG_NB_CA_diangle
+        CD1, CG, NB, geo.CA_NB_length, geo.CG_NB_CA_angle, geo.CD1_CG_NB_CA_diangle
     )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
+    CA = _new_atom("CA", carbon_a, " CA", "C")
     carbon = calculateCoordinates(
-        CG, NB, CA, CA_C_length, NB_CA_C_angle, CG_NB_CA_C_diangle
+        CG, NB, CA, geo.CA_C_length, geo.NB_CA_C_angle, geo.CG_NB_CA_C_diangle
     )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
+    C = _new_atom("C", carbon, " C", "C")
 
     ##Create Carbonyl atom (to be moved later)
-    C_O_length = geo.C_O_length
-    CA_C_O_angle = geo.CA_C_O_angle
-    NB_CA_C_O_diangle = geo.NB_CA_C_O_diangle1
-
     carbonyl = calculateCoordinates(
-        NB, CA, C, C_O_length, CA_C_O_angle, NB_CA_C_O_diangle
+        NB, CA, C, geo.C_O_length, geo.CA_C_O_angle, geo.NB_CA_C_O_diangle1
     )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    O = _new_atom("O", carbonyl, " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
 
@@ -634,23 +763,61 @@ def initialize_res(residue: Union[Geo, str]) -> Structure:
 
     struc = Structure("X")
     struc.add(mod)
+    struc._chainA = cha
+    struc._tail_residue = res
     return struc
 
 
+def _chain_A(structure: Structure) -> Chain:
+    """Chain A of model 0, cached on the structure after the first
+    traversal so the per-residue __getitem__ walk happens once."""
+    cha = getattr(structure, "_chainA", None)
+    ##Entity.copy() shallow-copies the structure's __dict__, so a copied
+    ##structure starts out with a cached chain that still belongs to the
+    ##original; re-derive whenever the chain's parent model is no longer
+    ##attached to this structure
+    if cha is None or cha.parent is None or cha.parent.parent is not structure:
+        cha = structure._chainA = structure[0]["A"]
+    return cha
+
+
 def getReferenceResidue(structure: Structure) -> Residue:
     """Returns the last residue of chain A model 0 of the given structure.
 
     This function is a helper function that should not normally be called
     directly."""
 
-    # If the following line doesn't work we're in trouble.
-    # Likely initialize_res() wasn't called.
-    resRef = structure[0]["A"].child_list[-1]
-
-    # If the residue is not an amino acid we're in trouble.
-    # Likely somebody is trying to append residues to an existing
-    # structure that has non-amino-acid molecules in the chain.
-    assert is_aa(resRef)
+    ##The builders cache the chain tail on the structure so extension
+    ##does not traverse model/chain/child_list on every residue
+    resRef = getattr(structure, "_tail_residue", None)
+    if resRef is not None:
+        ##Entity.copy() carries the cache over to the copy, where it
+        ##still points into the original structure, and detach_child
+        ##orphans the cached residue; only trust a tail whose parent
+        ##chain leads back to this structure
+        cha = resRef.parent
+        if cha is None or cha.parent is None or cha.parent.parent is not structure:
+            resRef = None
+    if resRef is None:
+        # If the following line doesn't work we're in trouble.
+        # Likely initialize_res() wasn't called.
+        resRef = structure[0]["A"].child_list[-1]
+
+        # If the residue is not an amino acid we're in trouble.
+        # Likely somebody is trying to append residues to an existing
+        # structure that has non-amino-acid molecules in the chain.
+        # Residues cached by our own builders skip the check: they are
+        # known good, and the linker motifs would fail is_aa anyway.
+        assert is_aa(resRef)
+
+        ##Residues that did not pass through _fill_residue (e.g. from a
+        ##PDBParser round trip) lack the builder slots the hot paths
+        ##dereference; backfill them once here on the cold path
+        rd = resRef.__dict__
+        rd["_id_num"] = resRef.id[1]
+        for aid, atom in resRef.child_dict.items():
+            if aid in _TAIL_REF_NAMES:
+                rd["_" + aid] = atom
 
     return resRef
 
@@ -658,64 +825,32 @@ def add_residue_from_geo_ala_aa(structure: Structure, geo: Geo) -> Structure:
 
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-
-    N_coord = calculateCoordinates(
-        resRef["N"], resRef["CA"], resRef["C"], geo.N_C_length, geo.N_C_CA_angle, geo.N_C_CA_N_diangle
-    )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-
-    CD1_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N, geo.CD1_N_length, geo.CD1_N_C_angle, geo.CD1_N_C_CA_diangle
-    )
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
+    segID = resRef._id_num + 1
 
-    CG_coord = calculateCoordinates(resRef["C"], N, CD1, geo.CG_CD1_length, geo.CG_CD1_N_angle,
-                                    geo.CG_CD1_N_C_diangle)
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
 
-    NB = calculateCoordinates(
-        N, CD1, CG, geo.NB_CG_length, geo.NB_CG_CD1_angle, geo.NB_CG_CD1_N_diangle
-    )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
-    carbon_a = calculateCoordinates(
-        CD1, CG, NB, geo.CA_NB_length, geo.CA_NB_CG_angle, geo.CA_NB_CG_CD1_diangle
-    )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
-    carbon = calculateCoordinates(
-        CG, NB, CA, geo.C_CA_length, geo.C_CA_NB_angle, geo.C_CA_NB_CG_diangle
-    )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
-    ##Create Carbonyl atom (to be moved later)
+    ##The seven backbone atoms form a strict rolling three-atom chain;
+    ##parameters are memoized on the geo until one of its attributes changes
+    offs = _geo_chain_offsets(geo, "ala_aa", _ala_aa_chain_params)
+    coords = _chain_place(
+        resRef._N.coord.astype(np.float64), resRef._CA.coord.astype(np.float64),
+        resRef._C.coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
 
-    carbonyl = calculateCoordinates(
-        NB, CA, C, geo.O_C_length, geo.O_C_CA_angle, geo.O_C_CA_NB_diangle
-    )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    N = _new_atom("N", coords[0], " N", "N")
+    CD1 = _new_atom("CD1", coords[1], " CD1", "C")
+    CG = _new_atom("CG", coords[2], " CG", "C")
+    NB = _new_atom("NB", coords[3], " NB", "N")
+    CA = _new_atom("CA", coords[4], " CA", "C")
+    C = _new_atom("C", coords[5], " C", "C")
+    O = _new_atom("O", coords[6], " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
 
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 
-def add_residue_ala_aa(structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_ala_aa(structure, geo)
 
 def add_residue_from_geo_aa_ala(structure: Structure, geo: Geo) -> Structure:
     """Adds a residue to chain A model 0 of the given structure, and
@@ -726,56 +861,38 @@ def add_residue_from_geo_aa_ala(structure: Structure, geo: Geo) -> Structure:
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
+    segID = resRef._id_num + 1
 
     ##geometry to bring together residue
 
 
     N_coord = calculateCoordinates(
-        resRef["NB"], resRef["CA"], resRef["C"], geo.N_C_length, geo.N_C_CA_angle, geo.N_C_CA_NB_diangle
+        resRef._NB, resRef._CA, resRef._C, geo.N_C_length, geo.N_C_CA_angle, geo.N_C_CA_NB_diangle
     )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
+    N = _new_atom("N", N_coord, " N", "N")
 
     CA_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N, geo.CA_N_length, geo.CA_N_C_angle, geo.CA_N_C_CA_diangle
+        resRef._CA, resRef._C, N, geo.CA_N_length, geo.CA_N_C_angle, geo.CA_N_C_CA_diangle
     )
-    CA = Atom("CA", CA_coord, 0.0, 1.0, " ", " CA", 0, "C")
+    CA = _new_atom("CA", CA_coord, " CA", "C")
 
-    C_coord = calculateCoordinates(resRef["C"], N, CA, geo.C_CA_length, geo.C_CA_N_angle, geo.C_CA_N_C_diangle)
-    C = Atom("C", C_coord, 0.0, 1.0, " ", " C", 0, "C")
+    C_coord = calculateCoordinates(resRef._C, N, CA, geo.C_CA_length, geo.C_CA_N_angle, geo.C_CA_N_C_diangle)
+    C = _new_atom("C", C_coord, " C", "C")
 
     ##Create Carbonyl atom (to be moved later)
 
     carbonyl = calculateCoordinates(
         N, CA, C, geo.C_O_length, geo.CA_C_O_angle, geo.N_CA_C_O_diangle
     )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    O = _new_atom("O", carbonyl, " O", "O")
 
     res = make_res_of_type_natural(segID, N, CA, C, O, geo)
 
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 
-def add_residue_aa_ala(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_aa_ala(structure, geo)
-
 
 def add_residue_from_geo_alalinker(structure: Structure, geo: Geo) -> Structure:
     """Adds a residue to chain A model 0 of the given structure, and
@@ -786,172 +903,95 @@ def add_residue_from_geo_alalinker(structure: Structure, geo: Geo) -> Structure:
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-    N1_C_length=geo.N1_C_length
-    N1_C_CA_angle=geo.N1_C_CA_angle
-    N1_C_CA_N_diangle=geo.N1_C_CA_N_diangle
-
-    C5_N1_length=geo.C5_N1_length
-    C5_N1_C_angle=geo.C5_N1_C_angle
-    C5_N1_C_CA_diangle=geo.C5_N1_C_CA_diangle
-
-    C6_C5_length=geo.C6_C5_length
-    C6_C5_N1_angle=geo.C6_C5_N1_angle
-    C6_C5_N1_C_diangle=geo.C6_C5_N1_C_diangle
-
-    C7_C6_length=geo.C7_C6_length
-    C7_C6_C5_angle=geo.C7_C6_C5_angle
-    C7_C6_C5_N1_diangle=geo.C7_C6_C5_N1_diangle
-
-    C8_C7_length=geo.C8_C7_length
-    C8_C7_C6_angle=geo.C8_C7_C6_angle
-    C8_C7_C6_C5_diangle=geo.C8_C7_C6_C5_diangle
-
-    O3_C8_length=geo.O3_C8_length
-    O3_C8_C7_angle=geo.O3_C8_C7_angle
-    O3_C8_C7_C6_diangle=geo.O3_C8_C7_C6_diangle
-
-    N2_C8_length=geo.N2_C8_length
-    N2_C8_C7_angle=geo.N2_C8_C7_angle
-    N2_C8_C7_C6_diangle=geo.N2_C8_C7_C6_diangle
-
-    C9_N2_length=geo.C9_N2_length
-    C9_N2_C8_angle=geo.C9_N2_C8_angle
-    C9_N2_C8_C7_diangle=geo.C9_N2_C8_C7_diangle
-
-    C10_C9_length=geo.C10_C9_length
-    C10_C9_N2_angle=geo.C10_C9_N2_angle
-    C10_C9_N2_C8_diangle=geo.C10_C9_N2_C8_diangle
-
-    O4_C10_length=geo.O4_C10_length
-    O4_C10_C9_angle=geo.O4_C10_C9_angle
-    O4_C10_C9_N2_diangle=geo.O4_C10_C9_N2_diangle
-
-    N3_C10_length=geo.N3_C10_length
-    N3_C10_C9_angle=geo.N3_C10_C9_angle
-    N3_C10_C9_N2_diangle=geo.N3_C10_C9_N2_diangle
-
-    C11_N3_length=geo.C11_N3_length
-    C11_N3_C10_angle=geo.C11_N3_C10_angle
-    C11_N3_C10_C9_diangle=geo.C11_N3_C10_C9_diangle
-
-    C12_C11_length=geo.C12_C11_length
-    C12_C11_N3_angle=geo.C12_C11_N3_angle
-    C12_C11_N3_C10_diangle=geo.C12_C11_N3_C10_diangle
-
-    C13_C12_length=geo.C13_C12_length
-    C13_C12_C11_angle=geo.C13_C12_C11_angle
-    C13_C12_C11_N3_diangle=geo.C13_C12_C11_N3_diangle
-
-    N1_coord = calculateCoordinates(
-        resRef["N"], resRef["CA"], resRef["C"], N1_C_length, N1_C_CA_angle, N1_C_CA_N_diangle
-    )
-    N1 = Atom("N", N1_coord, 0.0, 1.0, " ", " N", 0, "N")
-    C5_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N1, C5_N1_length, C5_N1_C_angle, C5_N1_C_CA_diangle
-    )
-    C5 = Atom("CA", C5_coord, 0.0, 1.0, " ", " CG", 0, "C")
-    C6_coord = calculateCoordinates(resRef["C"], N1, C5, C6_C5_length, C6_C5_N1_angle, C6_C5_N1_C_diangle)
-    C6 = Atom("CB", C6_coord, 0.0, 1.0, " ", " CB", 0, "C")
-
-    C7_coord = calculateCoordinates(N1, C5, C6,C7_C6_length, C7_C6_C5_angle, C7_C6_C5_N1_diangle)
-    C7 = Atom("CG", C7_coord, 0.0, 1.0, " ", " CA", 0, "C")
-    C8_coord = calculateCoordinates(C5, C6, C7, C8_C7_length, C8_C7_C6_angle, C8_C7_C6_C5_diangle)
-    C8 = Atom("C", C8_coord, 0.0, 1.0, " ", " C", 0, "C")
-    O3_coord = calculateCoordinates(C6, C7, C8, O3_C8_length, O3_C8_C7_angle, O3_C8_C7_C6_diangle)
-    O3 = Atom("O", O3_coord, 0.0, 1.0, " ", " O", 0, "O")
-    N2_coord = calculateCoordinates(C6, C7, C8, N2_C8_length, N2_C8_C7_angle, N2_C8_C7_C6_diangle)
-    N2 = Atom("N2", N2_coord, 0.0, 1.0, " ", " N", 0, "N")
-    C9_coord = calculateCoordinates(C7, C8, N2, C9_N2_length, C9_N2_C8_angle, C9_N2_C8_C7_diangle)
-    C9 = Atom("C9", C9_coord, 0.0, 1.0, " ", " CA", 0, "C")
-    C10_coord = calculateCoordinates(C8, N2, C9,C10_C9_length, C10_C9_N2_angle, C10_C9_N2_C8_diangle)
-    C10 = Atom("C10", C10_coord, 0.0, 1.0, " ", " C", 0, "C")
-    O4_coord = calculateCoordinates(N2, C9, C10, O4_C10_length, O4_C10_C9_angle, O4_C10_C9_N2_diangle)
-    O4 = Atom("O4", O4_coord, 0.0, 1.0, " ", " O", 0, "O")
-    N3_coord = calculateCoordinates(N2, C9, C10, N3_C10_length, N3_C10_C9_angle, N3_C10_C9_N2_diangle)
-    N3 = Atom("N3", N3_coord, 0.0, 1.0, " ", " N", 0, "N")
-    C11_coord = calculateCoordinates(C9, C10, N3, C11_N3_length, C11_N3_C10_angle, C11_N3_C10_C9_diangle)
-    C11 = Atom("C11", C11_coord, 0.0, 1.0, " ", " CG", 0, "C")
-    C12_coord = calculateCoordinates(C10, N3, C11, C12_C11_length, C12_C11_N3_angle, C12_C11_N3_C10_diangle)
-    C12 = Atom("C12", C12_coord, 0.0, 1.0, " ", " CB", 0, "C")
-    C13_coord = calculateCoordinates(N3, C11, C12, C13_C12_length, C13_C12_C11_angle, C13_C12_C11_N3_diangle)
-    C13 = Atom("C13", C13_coord, 0.0, 1.0, " ", " CA", 0, "C")
-    C4_coord = calculateCoordinates(C11, C12, C13, geo.C4_C13_length, geo.C4_C13_C12_angle, geo.C4_C13_C12_C11_diangle)
-    C4 = Atom("C4", C4_coord, 0.0, 1.0, " ", " C", 0, "C")
-    O2_coord = calculateCoordinates(C12, C13, C4, geo.O2_C4_length, geo.O2_C4_C13_angle, geo.O2_C4_C13_C12_diangle)
-    O2 = Atom("O2", O2_coord, 0.0, 1.0, " ", " O", 0, "O")
+    segID = resRef._id_num + 1
+
+    ##One memoized (16, 3) parameter block replaces the per-call
+    ##attribute transcription; row order matches the placement order
+    p = _geo_param_array(geo, "alalinker", _alalinker_chain_params)
+
+    prev_n = resRef._N.coord
+    prev_ca = resRef._CA.coord
+    prev_c = resRef._C.coord
+
+    ##Chain the sixteen linker placements on raw coordinate arrays,
+    ##fusing the pairs that share a parent frame into one basis build
+    n1 = _place_atom(prev_n, prev_ca, prev_c, p[0, 0], p[0, 1], p[0, 2])
+    c5 = _place_atom(prev_ca, prev_c, n1, p[1, 0], p[1, 1], p[1, 2])
+    c6 = _place_atom(prev_c, n1, c5, p[2, 0], p[2, 1], p[2, 2])
+    c7 = _place_atom(n1, c5, c6, p[3, 0], p[3, 1], p[3, 2])
+    c8 = _place_atom(c5, c6, c7, p[4, 0], p[4, 1], p[4, 2])
+    o3, n2 = _place_atoms_shared_frame(
+        c6, c7, c8, p[5:7, 0], p[5:7, 1], p[5:7, 2]
+    )
+    c9 = _place_atom(c7, c8, n2, p[7, 0], p[7, 1], p[7, 2])
+    c10 = _place_atom(c8, n2, c9, p[8, 0], p[8, 1], p[8, 2])
+    o4, n3 = _place_atoms_shared_frame(
+        n2, c9, c10, p[9:11, 0], p[9:11, 1], p[9:11, 2]
+    )
+    c11 = _place_atom(c9, c10, n3, p[11, 0], p[11, 1], p[11, 2])
+    c12 = _place_atom(c10, n3, c11, p[12, 0], p[12, 1], p[12, 2])
+    c13 = _place_atom(n3, c11, c12, p[13, 0], p[13, 1], p[13, 2])
+    c4 = _place_atom(c11, c12, c13, p[14, 0], p[14, 1], p[14, 2])
+    o2 = _place_atom(c12, c13, c4, p[15, 0], p[15, 1], p[15, 2])
+
+    ##One contiguous block for the linker; each Atom gets a row view
+    block = np.stack(
+        (n1, c5, c6, c7, c8, o3, n2, c9, c10, o4, n3, c11, c12, c13, c4, o2)
+    ).astype(COORD_DTYPE, copy=False)
+    N1 = _new_atom("N", block[0], " N", "N")
+    C5 = _new_atom("CA", block[1], " CG", "C")
+    C6 = _new_atom("CB", block[2], " CB", "C")
+    C7 = _new_atom("CG", block[3], " CA", "C")
+    C8 = _new_atom("C", block[4], " C", "C")
+    O3 = _new_atom("O", block[5], " O", "O")
+    N2 = _new_atom("N2", block[6], " N", "N")
+    C9 = _new_atom("C9", block[7], " CA", "C")
+    C10 = _new_atom("C10", block[8], " C", "C")
+    O4 = _new_atom("O4", block[9], " O", "O")
+    N3 = _new_atom("N3", block[10], " N", "N")
+    C11 = _new_atom("C11", block[11], " CG", "C")
+    C12 = _new_atom("C12", block[12], " CB", "C")
+    C13 = _new_atom("C13", block[13], " CA", "C")
+    C4 = _new_atom("C4", block[14], " C", "C")
+    O2 = _new_atom("O2", block[15], " O", "O")
     res = make_res_of_type_linker(segID, N1, C5, C6, C7, C8, O3, N2, C9, C10, O4, N3, C11, C12, C13, C4, O2, geo)
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return res
 
-def add_residue_alalinker(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_alalinker(structure, geo)
 def add_residue_from_geo_linker_ala(structure: Structure, geo: Geo) -> Structure:
 
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
+    segID = resRef._id_num + 1
 
 
     N_coord = calculateCoordinates(
-        resRef["C12"], resRef["C13"], resRef["C4"], geo.N_C4_length, geo.N_C4_C13_angle, geo.N_C4_C13_C12_diangle
+        resRef._C12, resRef._C13, resRef._C4, geo.N_C4_length, geo.N_C4_C13_angle, geo.N_C4_C13_C12_diangle
     )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
+    N = _new_atom("N", N_coord, " N", "N")
 
     CA_coord = calculateCoordinates(
-        resRef["C13"], resRef["C4"], N, geo.CA_N_length, geo.CA_N_C4_angle, geo.CA_N_C4_C13_diangle
+        resRef._C13, resRef._C4, N, geo.CA_N_length, geo.CA_N_C4_angle, geo.CA_N_C4_C13_diangle
     )
-    CA = Atom("CA", CA_coord, 0.0, 1.0, " ", " CA", 0, "C")
+    CA = _new_atom("CA", CA_coord, " CA", "C")
 
-    C_coord = calculateCoordinates(resRef["C4"], N, CA, geo.C_CA_length, geo.C_CA_N_angle, geo.C_CA_N_C4_diangle)
-    C = Atom("C", C_coord, 0.0, 1.0, " ", " C", 0, "C")
+    C_coord = calculateCoordinates(resRef._C4, N, CA, geo.C_CA_length, geo.C_CA_N_angle, geo.C_CA_N_C4_diangle)
+    C = _new_atom("C", C_coord, " C", "C")
 
     ##Create Carbonyl atom (to be moved later)
 
     carbonyl = calculateCoordinates(
         N, CA, C, geo.C_O_length, geo.CA_C_O_angle, geo.N_CA_C_O_diangle
     )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    O = _new_atom("O", carbonyl, " O", "O")
 
     res = make_res_of_type_natural(segID, N, CA, C, O, geo)
 
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
-def add_residue_linker_ala(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_linker_ala(structure, geo)
 # right
 def add_residue_from_geo(structure: Structure, geo: Geo) -> Structure:
     """Adds a residue to chain A model 0 of the given structure, and
@@ -962,78 +1002,28 @@ def add_residue_from_geo(structure: Structure, geo: Geo) -> Structure:
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-    ##geometry to bring together residue
-    peptide_bond = geo.peptide_bond
-    CA_C_N_angle = geo.CA_C_N_angle
-
-    ##Backbone Coordinates
-
-    CG_NB_CA_C_diangle1 = geo.CG_NB_CA_C_diangle1
-    NB_CA_C_N_diangle = geo.NB_CA_C_N_diangle
-
-    a = geo.a
-    c = geo.c
-    N_CD1_CG_NB_diangle = geo.N_CD1_CG_NB_diangle
-
-    CA_NB_length = geo.CA_NB_length
-    CA_C_length = geo.CA_C_length
-    NB_CA_C_angle = geo.NB_CA_C_angle
-
-    CA_C_N_angle = geo.CA_C_N_angle
-
-    C_N_CD1_angle = geo.C_N_CD1_angle
-
-    N_CD1_length = geo.N_CD1_length
-    N_CD1_CG_angle = geo.N_CD1_CG_angle
-
-    CD1_CG_length = geo.CD1_CG_length
-    CD1_CG_NB_angle = geo.CD1_CG_NB_angle
-
-    CG_NB_length = geo.CG_NB_length
-    CG_NB_CA_angle = geo.CG_NB_CA_angle
-    CA_C_N_CD1_diangle = geo.CA_C_N_CD1_diangle
-
-    N_coord = calculateCoordinates(
-        resRef["NB"], resRef["CA"], resRef["C"], peptide_bond, CA_C_N_angle, NB_CA_C_N_diangle
-    )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-
-    CD1_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N, N_CD1_length, C_N_CD1_angle, CA_C_N_CD1_diangle
-    )
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
-
-    CG_coord = calculateCoordinates(resRef["C"], N, CD1, CD1_CG_length, N_CD1_CG_angle, c)
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
-
-    NB = calculateCoordinates(
-        N, CD1, CG, CG_NB_length, CD1_CG_NB_angle, N_CD1_CG_NB_diangle
-    )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
-    carbon_a = calculateCoordinates(
-        CD1, CG, NB, CA_NB_length, CG_NB_CA_angle, a
-    )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
-    carbon = calculateCoordinates(
-        CG, NB, CA, CA_C_length, NB_CA_C_angle, CG_NB_CA_C_diangle1
-    )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
-    ##Create Carbonyl atom (to be moved later)
-    C_O_length = geo.C_O_length
-    CA_C_O_angle = geo.CA_C_O_angle
-    NB_CA_C_O_diangle1 = geo.NB_CA_C_O_diangle1
-
-    carbonyl = calculateCoordinates(
-        NB, CA, C, C_O_length, CA_C_O_angle, NB_CA_C_O_diangle1
-    )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    segID = resRef._id_num + 1
+
+    ##The seven backbone atoms form a strict rolling three-atom chain;
+    ##parameters are memoized on the geo until one of its attributes changes
+    offs = _geo_chain_offsets(geo, "aa", _aa_chain_params)
+    coords = _chain_place(
+        resRef._NB.coord.astype(np.float64), resRef._CA.coord.astype(np.float64),
+        resRef._C.coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
+
+    N = _new_atom("N", coords[0], " N", "N")
+    CD1 = _new_atom("CD1", coords[1], " CD1", "C")
+    CG = _new_atom("CG", coords[2], " CG", "C")
+    NB = _new_atom("NB", coords[3], " NB", "N")
+    CA = _new_atom("CA", coords[4], " CA", "C")
+    C = _new_atom("C", coords[5], " C", "C")
+    O = _new_atom("O", coords[6], " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 
 # AA_AA
@@ -1046,75 +1036,31 @@ def add_residue_from_geo_AA_AA(structure: Structure, geo: Geo) -> Structure:
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-    N_C_length = geo.N_C_length
-    N_C_CA_angle = geo.N_C_CA_angle
-    N_C_CA_NB_diangle = geo.N_C_CA_NB_diangle
-
-    CD1_N_length = geo.CD1_N_length
-    CD1_N_C_angle = geo.CD1_N_C_angle
-    CD1_N_C_CA_diangle = geo.CD1_N_C_CA_diangle
-
-    CG_CD1_length = geo.CG_CD1_length
-    CG_CD1_N_angle = geo.CG_CD1_N_angle
-    CG_CD1_N_C_diangle = geo.CG_CD1_N_C_diangle
-
-    CG_NB_length = geo.NB_CG_length
-    CD1_CG_NB_angle = geo.NB_CG_CD1_angle
-    N_CD1_CG_NB_diangle = geo.NB_CG_CD1_N_diangle
-
-    CA_NB_length = geo.CA_NB_length
-    CG_NB_CA_angle = geo.CA_NB_CG_angle
-    CA_NB_CG_CD1_diangle = geo.CA_NB_CG_CD1_diangle
-
-    CA_C_length = geo.C_CA_length
-    NB_CA_C_angle = geo.C_CA_NB_angle
-    CG_NB_CA_C_diangle = geo.C_CA_NB_CG_diangle
-
-    N_coord = calculateCoordinates(
-        resRef["NB"], resRef["CA"], resRef["C"], N_C_length, N_C_CA_angle, N_C_CA_NB_diangle
-    )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-
-    CD1_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N, CD1_N_length, CD1_N_C_angle, CD1_N_C_CA_diangle
-    )
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
-
-    CG_coord = calculateCoordinates(resRef["C"], N, CD1, CG_CD1_length, CG_CD1_N_angle, CG_CD1_N_C_diangle)
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
-
-    NB = calculateCoordinates(
-        N, CD1, CG, CG_NB_length, CD1_CG_NB_angle, N_CD1_CG_NB_diangle
-    )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
-    carbon_a = calculateCoordinates(
-        CD1, CG, NB, CA_NB_length, CG_NB_CA_angle, CA_NB_CG_CD1_diangle
-    )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
-    carbon = calculateCoordinates(
-        CG, NB, CA, CA_C_length, NB_CA_C_angle, CG_NB_CA_C_diangle
-    )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
-    ##Create Carbonyl atom (to be moved later)
-    C_O_length = geo.C_O_length
-    CA_C_O_angle = geo.CA_C_O_angle
-    NB_CA_C_O_diangle = geo.NB_CA_C_O_diangle
-
-    carbonyl = calculateCoordinates(
-        NB, CA, C, C_O_length, CA_C_O_angle, NB_CA_C_O_diangle
-    )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    segID = resRef._id_num + 1
+
+    ##Same rolling three-atom chain as add_residue_from_geo; parameters
+    ##are memoized on the geo until one of its attributes changes
+    offs = _geo_chain_offsets(geo, "AA_AA", _AA_AA_chain_params)
+    coords = _chain_place(
+        resRef._NB.coord.astype(np.float64), resRef._CA.coord.astype(np.float64),
+        resRef._C.coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
+
+    N = _new_atom("N", coords[0], " N", "N")
+    CD1 = _new_atom("CD1", coords[1], " CD1", "C")
+    CG = _new_atom("CG", coords[2], " CG", "C")
+    NB = _new_atom("NB", coords[3], " NB", "N")
+    CA = _new_atom("CA", coords[4], " CA", "C")
+    C = _new_atom("C", coords[5], " C", "C")
+    O = _new_atom("O", coords[6], " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 
 
-
 def add_residue_from_geo_linker2_1_aa(structure: Structure, geo: Geo) -> Structure:
     """Adds a residue to chain A model 0 of the given structure, and
     returns the new structure. The residue to be added is determined by
@@ -1124,69 +1070,28 @@ def add_residue_from_geo_linker2_1_aa(structure: Structure, geo: Geo) -> Structu
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-    N_CL_length = geo.N_CL_length
-    N_CL_C15_angle = geo.N_CL_C15_angle
-    N_CL_C15_C14_diangle = geo.N_CL_C15_C14_diangle
-
-    N_CD1_length = geo.N_CD1_length
-    CD1_N_CL_angle = geo.CD1_N_CL_angle
-    CD1_N_CL_C15_diangle = geo.CD1_N_CL_C15_diangle
-
-    CG_CD1_length = geo.CD1_CG_length
-    CG_CD1_N_angle = geo.N_CD1_CG_angle
-    CG_CD1_N_CL_diangle = geo.CG_CD1_N_CL_diangle
-
-    CG_NB_length = geo.CG_NB_length
-    CD1_CG_NB_angle = geo.CD1_CG_NB_angle
-    N_CD1_CG_NB_diangle = geo.N_CD1_CG_NB_diangle
-
-    CA_NB_length = geo.CA_NB_length
-    CG_NB_CA_angle = geo.CG_NB_CA_angle
-    a1 = geo.a1
-
-    CA_C_length = geo.CA_C_length
-    NB_CA_C_angle = geo.NB_CA_C_angle
-    CG_NB_CA_C_diangle = geo.CG_NB_CA_C_diangle
-    N_coord = calculateCoordinates(
-        resRef["C14"], resRef["CA"], resRef["C"], N_CL_length, N_CL_C15_angle, N_CL_C15_C14_diangle
-    )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-
-    CD1_coord = calculateCoordinates(
-        resRef["CA"], resRef["C"], N, N_CD1_length, CD1_N_CL_angle, CD1_N_CL_C15_diangle
-    )
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
-
-    CG_coord = calculateCoordinates(resRef["C"], N, CD1, CG_CD1_length, CG_CD1_N_angle, CG_CD1_N_CL_diangle)
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
-
-    NB = calculateCoordinates(
-        N, CD1, CG, CG_NB_length, CD1_CG_NB_angle, N_CD1_CG_NB_diangle
-    )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
-    carbon_a = calculateCoordinates(
-        CD1, CG, NB, CA_NB_length, CG_NB_CA_angle, a1
-    )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
-    carbon = calculateCoordinates(
-        CG, NB, CA, CA_C_length, NB_CA_C_angle, CG_NB_CA_C_diangle
-    )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
-    C_O_length = geo.C_O_length
-    CA_C_O_angle = geo.CA_C_O_angle
-    NB_CA_C_O_diangle = geo.NB_CA_C_O_diangle
-
-    carbonyl = calculateCoordinates(
-        NB, CA, C, C_O_length, CA_C_O_angle, NB_CA_C_O_diangle
-    )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    segID = resRef.get_id()[1] + 1
+
+    ##The seven placements are a strict rolling three-atom chain, the
+    ##same shape as add_residue_from_geo: one fused kernel call
+    offs = _geo_chain_offsets(geo, "linker2_1", _linker2_1_chain_params)
+    coords = _chain_place(
+        resRef["C14"].coord.astype(np.float64), resRef["CA"].coord.astype(np.float64),
+        resRef["C"].coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
+
+    N = _new_atom("N", coords[0], " N", "N")
+    CD1 = _new_atom("CD1", coords[1], " CD1", "C")
+    CG = _new_atom("CG", coords[2], " CG", "C")
+    NB = _new_atom("NB", coords[3], " NB", "N")
+    CA = _new_atom("CA", coords[4], " CA", "C")
+    C = _new_atom("C", coords[5], " C", "C")
+    O = _new_atom("O", coords[6], " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
 
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 def add_residue_from_geo_linker2_3_aa(structure: Structure, geo: Geo) -> Structure:
     """Adds a residue to chain A model 0 of the given structure, and
@@ -1197,63 +1102,31 @@ def add_residue_from_geo_linker2_3_aa(structure: Structure, geo: Geo) -> Structu
     directly. Call add_residue() instead."""
     resRef = getReferenceResidue(structure)
     AA = geo.residue_name
-    segID = resRef.get_id()[1]
-    segID += 1
-
-    N_coord = calculateCoordinates(
-        resRef["C16"], resRef["C17"], resRef["CL"], geo.N_CL_length, geo.N_CL_C15_angle, geo.N_CL_C15_C14_diangle
-    )
-    N = Atom("N", N_coord, 0.0, 1.0, " ", " N", 0, "N")
-
-    CD1_coord = calculateCoordinates(
-        resRef["C17"], resRef["CL"], N, geo.N_CD1_length, geo.CD1_N_CL_angle, geo.CD1_N_CL_C15_diangle
-    )
-    CD1 = Atom("CD1", CD1_coord, 0.0, 1.0, " ", " CD1", 0, "C")
-
-    CG_coord = calculateCoordinates(resRef["CL"], N, CD1, geo.CD1_CG_length, geo.N_CD1_CG_angle, geo.CG_CD1_N_CL_diangle)
-    CG = Atom("CG", CG_coord, 0.0, 1.0, " ", " CG", 0, "C")
-
-    NB = calculateCoordinates(
-        N, CD1, CG, geo.CG_NB_length, geo.CD1_CG_NB_angle, geo.N_CD1_CG_NB_diangle
-    )
-    NB = Atom("NB", NB, 0.0, 1.0, " ", " NB", 0, "N")
-    carbon_a = calculateCoordinates(
-        CD1, CG, NB, geo.CA_NB_length, geo.CG_NB_CA_angle, geo.a1
-    )
-    CA = Atom("CA", carbon_a, 0.0, 1.0, " ", " CA", 0, "C")
-    carbon = calculateCoordinates(
-        CG, NB, CA, geo.CA_C_length, geo.NB_CA_C_angle, geo.CG_NB_CA_C_diangle
-    )
-    C = Atom("C", carbon, 0.0, 1.0, " ", " C", 0, "C")
-
-    carbonyl = calculateCoordinates(
-        NB, CA, C, geo.C_O_length, geo.CA_C_O_angle, geo.NB_CA_C_O_diangle
-    )
-    O = Atom("O", carbonyl, 0.0, 1.0, " ", " O", 0, "O")
+    segID = resRef.get_id()[1] + 1
+
+    ##Same placement recipe and parameter names as linker2_1: reuse its
+    ##memoized parameter rows and write all seven atoms into one block
+    offs = _geo_chain_offsets(geo, "linker2_1", _linker2_1_chain_params)
+    coords = _chain_place(
+        resRef["C16"].coord.astype(np.float64), resRef["C17"].coord.astype(np.float64),
+        resRef["CL"].coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
+
+    N = _new_atom("N", coords[0], " N", "N")
+    CD1 = _new_atom("CD1", coords[1], " CD1", "C")
+    CG = _new_atom("CG", coords[2], " CG", "C")
+    NB = _new_atom("NB", coords[3], " NB", "N")
+    CA = _new_atom("CA", coords[4], " CA", "C")
+    C = _new_atom("C", coords[5], " C", "C")
+    O = _new_atom("O", coords[6], " O", "O")
 
     res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
-    structure[0]["A"].add(res)
+    _chain_A(structure).add(res)
+    structure._tail_residue = res
     return structure
 
-def make_extended_structure(AA_chain: str) -> Structure:
-    """Place a sequence of amino acids into a peptide in the extended
-    conformation. The argument AA_chain holds the sequence of amino
-    acids to be used."""
-    geo = geometry(AA_chain[0])
-    struc = initialize_res(geo)
 
-    for i in range(1, len(AA_chain)):
-        AA = AA_chain[i]
-        geo = geometry(AA)
-        add_residue(struc, geo)
-
-    return struc
-
-
-def add_residue(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-    """Adds a residue to chain A model 0 of the given structure, and
+_ADD_RESIDUE_DOC = """Adds a residue to chain A model 0 of the given structure, and
     returns the new structure. The residue to be added can be specified
     in two ways: either as a geometry object (in which case
     the remaining arguments phi, psi_im1, and omega are ignored) or as a
@@ -1261,106 +1134,62 @@ def add_residue(
     arguments phi, psi_im1, and omega specify the corresponding backbone
     angles.
 
-    When omega is specified, it needs to be a value greater than or equal
-    to -360. Values below -360 are ignored."""
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
+    When omega is left at None, the default omega angle of the geometry
+    object is kept."""
+
+
+def _make_add_residue(builder):
+    """The public add_residue_* entry points differ only in which
+    add_residue_from_geo_* function they tail-call; build them all from
+    one template so the argument normalization lives in a single place."""
+
+    def add_residue_fn(
+            structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140,
+            omega: Optional[float] = None
+    ) -> Structure:
+        if isinstance(residue, Geo):
+            geo = residue
+        elif isinstance(residue, str):
+            geo = geometry(residue)
+            geo.phi = phi
+            geo.psi_im1 = psi_im1
+            if omega is not None:
+                geo.omega = omega
+        else:
+            raise ValueError("Invalid residue argument:", residue)
+        return builder(structure, geo)
+
+    ##Name each wrapper after its public binding so the functions stay
+    ##picklable and show up under their own names in tracebacks/help()
+    name = builder.__name__.replace("_from_geo", "", 1)
+    add_residue_fn.__name__ = name
+    add_residue_fn.__qualname__ = name
+    add_residue_fn.__doc__ = _ADD_RESIDUE_DOC
+    return add_residue_fn
+
+
+add_residue = _make_add_residue(add_residue_from_geo)
+add_residue_ala_aa = _make_add_residue(add_residue_from_geo_ala_aa)
+add_residue_aa_ala = _make_add_residue(add_residue_from_geo_aa_ala)
+add_residue_alalinker = _make_add_residue(add_residue_from_geo_alalinker)
+add_residue_linker_ala = _make_add_residue(add_residue_from_geo_linker_ala)
+add_residue_AA_AA = _make_add_residue(add_residue_from_geo_AA_AA)
+add_residue_linker2_1_aa = _make_add_residue(add_residue_from_geo_linker2_1_aa)
+add_residue_linker2_3_aa = _make_add_residue(add_residue_from_geo_linker2_3_aa)
 
-    return add_residue_from_geo(structure, geo)
-
-
-def add_residue_AA_AA(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-    """Adds a residue to chain A model 0 of the given structure, and
-    returns the new structure. The residue to be added can be specified
-    in two ways: either as a geometry object (in which case
-    the remaining arguments phi, psi_im1, and omega are ignored) or as a
-    single-letter amino-acid code. In the latter case, the optional
-    arguments phi, psi_im1, and omega specify the corresponding backbone
-    angles.
-
-    When omega is specified, it needs to be a value greater than or equal
-    to -360. Values below -360 are ignored."""
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_AA_AA(structure, geo)
-
-
-
-
-
-def add_residue_linker2_1_aa(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-    """Adds a residue to chain A model 0 of the given structure, and
-    returns the new structure. The residue to be added can be specified
-    in two ways: either as a geometry object (in which case
-    the remaining arguments phi, psi_im1, and omega are ignored) or as a
-    single-letter amino-acid code. In the latter case, the optional
-    arguments phi, psi_im1, and omega specify the corresponding backbone
-    angles.
-
-    When omega is specified, it needs to be a value greater than or equal
-    to -360. Values below -360 are ignored."""
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
-
-    return add_residue_from_geo_linker2_1_aa(structure, geo)
-def add_residue_linker2_3_aa(
-        structure: Structure, residue: Union[Geo, str], phi=-120, psi_im1=140, omega=-370
-) -> Structure:
-    """Adds a residue to chain A model 0 of the given structure, and
-    returns the new structure. The residue to be added can be specified
-    in two ways: either as a geometry object (in which case
-    the remaining arguments phi, psi_im1, and omega are ignored) or as a
-    single-letter amino-acid code. In the latter case, the optional
-    arguments phi, psi_im1, and omega specify the corresponding backbone
-    angles.
-
-    When omega is specified, it needs to be a value greater than or equal
-    to -360. Values below -360 are ignored."""
-
-    if isinstance(residue, Geo):
-        geo = residue
-    elif isinstance(residue, str):
-        geo = geometry(residue)
-        geo.phi = phi
-        geo.psi_im1 = psi_im1
-        if omega > -361:
-            geo.omega = omega
-    else:
-        raise ValueError("Invalid residue argument:", residue)
+def make_extended_structure(AA_chain: str) -> Structure:
+    """Place a sequence of amino acids into a peptide in the extended
+    conformation. The argument AA_chain holds the sequence of amino
+    acids to be used."""
+    geos = [_cached_geometry(AA) for AA in AA_chain]
+    if all(type(g) is AAGeo for g in geos):
+        ##Uniform AA chain: run the whole backbone in one kernel call
+        return build_chain_from_geos(geos)
 
-    return add_residue_from_geo_linker2_3_aa(structure, geo)
+    struc = initialize_res(geos[0])
+    for geo in geos[1:]:
+        add_residue(struc, geo)
+    return struc
 
 
 def make_structure(
@@ -1373,18 +1202,24 @@ def make_structure(
     the second amino acid in the chain*. The argument
     omega (optional) holds a list of omega angles, also starting from
     the second amino acid in the chain."""
-    geo = geometry(AA_chain[0])
-    struc = initialize_res(geo)
-
-    if omega is None or not len(omega):
-        for i in range(1, len(AA_chain)):
-            AA = AA_chain[i]
-            add_residue(struc, AA, phi[i - 1], psi_im1[i - 1])
-    else:
-        for i in range(1, len(AA_chain)):
-            AA = AA_chain[i]
-            add_residue(struc, AA, phi[i - 1], psi_im1[i - 1], omega[i - 1])
-
+    geos = [_cached_geometry(AA_chain[0])]
+    has_omega = omega is not None and len(omega)
+    for i in range(1, len(AA_chain)):
+        geo = _cached_geometry(AA_chain[i])
+        geo.phi = phi[i - 1]
+        geo.psi_im1 = psi_im1[i - 1]
+        if has_omega:
+            geo.omega = omega[i - 1]
+        geos.append(geo)
+
+    if all(type(g) is AAGeo for g in geos):
+        ##The per-residue trig all lives in the parameter arrays; the
+        ##serial frame accumulation runs once inside the bulk kernel
+        return build_chain_from_geos(geos)
+
+    struc = initialize_res(geos[0])
+    for geo in geos[1:]:
+        add_residue(struc, geo)
     return struc
 
 
@@ -1397,38 +1232,95 @@ def make_structure_from_geos(geos: List[Geo]) -> Structure:
     return model_structure
 
 
+def build_chain_from_geos(geos: List[Geo]) -> Structure:
+    """Bulk equivalent of make_structure_from_geos for AA-type geometries:
+    collects the backbone parameters of every residue after the first and
+    places all of them with a single chained kernel call, then constructs
+    the residue objects around the finished coordinate block."""
+    structure = initialize_res(geos[0])
+    rest = geos[1:]
+    if not rest:
+        return structure
+
+    offs = np.empty((len(rest), 7, 3))
+    for i, geo in enumerate(rest):
+        if isinstance(geo, AA_AAGeo):
+            offs[i] = _geo_chain_offsets(geo, "AA_AA", _AA_AA_chain_params)
+        elif isinstance(geo, AAGeo):
+            offs[i] = _geo_chain_offsets(geo, "aa", _aa_chain_params)
+        else:
+            raise ValueError("Invalid residue geometry for bulk assembly:", geo)
+
+    resRef = getReferenceResidue(structure)
+    coords = _chain_place_multi(
+        resRef._NB.coord.astype(np.float64), resRef._CA.coord.astype(np.float64),
+        resRef._C.coord.astype(np.float64), offs
+    ).astype(COORD_DTYPE, copy=False)
+
+    cha = _chain_A(structure)
+    segID = resRef._id_num
+    residues = []
+    for i, geo in enumerate(rest):
+        segID += 1
+        rows = coords[i]
+        N = _new_atom("N", rows[0], " N", "N")
+        CD1 = _new_atom("CD1", rows[1], " CD1", "C")
+        CG = _new_atom("CG", rows[2], " CG", "C")
+        NB = _new_atom("NB", rows[3], " NB", "N")
+        CA = _new_atom("CA", rows[4], " CA", "C")
+        C = _new_atom("C", rows[5], " C", "C")
+        O = _new_atom("O", rows[6], " O", "O")
+        res = make_res_of_type_aa(segID, N, CD1, CG, NB, CA, C, O, geo)
+        res.set_parent(cha)
+        residues.append(res)
+    ##Attach all residues in one pass instead of per-residue Chain.add
+    ##calls; ids are fresh segIDs, so the duplicate check is redundant
+    cha.child_list.extend(residues)
+    cha.child_dict.update((r.id, r) for r in residues)
+    structure._tail_residue = res
+    return structure
+
+
+def _oxt_from_backbone(
+        n: np.ndarray, ca: np.ndarray, c: np.ndarray, o: np.ndarray, L: float
+) -> np.ndarray:
+    """Place the terminal OXT directly from the backbone coordinates.
+
+    OXT shares O's bond angle at C with the dihedral flipped by 180
+    degrees, so in the N-CA-C placement frame its direction is O's unit
+    direction with the two in-plane components negated - one frame
+    build and three dot products, no angle extraction round trip."""
+    bc = c - ca
+    bc = bc / math.sqrt(bc[0] * bc[0] + bc[1] * bc[1] + bc[2] * bc[2])
+    nv = np.cross(ca - n, bc)
+    nv = nv / math.sqrt(nv[0] * nv[0] + nv[1] * nv[1] + nv[2] * nv[2])
+    m = np.cross(nv, bc)
+
+    u = o - c
+    u = u / math.sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2])
+    return c + L * (np.dot(u, bc) * bc - np.dot(u, m) * m - np.dot(u, nv) * nv)
+
+
 def add_terminal_OXT(structure: Structure, C_OXT_length: float = 1.23) -> Structure:
     """Adds a terminal oxygen atom ('OXT') to the last residue of chain A model 0 of the given structure,
     and returns the new structure. The OXT atom object will be contained in the last residue object of the structure.
 
 This function should be used only when the structure object is completed and no further residues need to be appended."""
 
-    rad = 180.0 / math.pi
-
     # obtain last residue infomation
     resRef = getReferenceResidue(structure)
-    N_resRef = resRef["N"]
-    CA_resRef = resRef["CA"]
-    C_resRef = resRef["C"]
-    O_resRef = resRef["O"]
-
-    n_vec = N_resRef.get_vector()
-    ca_vec = CA_resRef.get_vector()
-    c_vec = C_resRef.get_vector()
-    o_vec = O_resRef.get_vector()
-
-    # geometry to bring together residue
-    CA_C_OXT_angle = calc_angle(ca_vec, c_vec, o_vec) * rad
-    N_CA_C_O_diangle = calc_dihedral(n_vec, ca_vec, c_vec, o_vec) * rad
-    N_CA_C_OXT_diangle = N_CA_C_O_diangle - 180.0
-    if N_CA_C_O_diangle < 0:
-        N_CA_C_OXT_diangle = N_CA_C_O_diangle + 180.0
-
-    # OXT atom creation
-    OXT_coord = calculateCoordinates(
-        N_resRef, CA_resRef, C_resRef, C_OXT_length, CA_C_OXT_angle, N_CA_C_OXT_diangle
-    )
-    OXT = Atom("OXT", OXT_coord, 0.0, 1.0, " ", "OXT", 0, "O")
+
+    # OXT atom creation: one fused pass over the backbone coordinates
+    # instead of calc_angle + calc_dihedral + calculateCoordinates all
+    # rebuilding the same bond vectors
+    OXT_coord = _oxt_from_backbone(
+        resRef._N.coord.astype(np.float64),
+        resRef._CA.coord.astype(np.float64),
+        resRef._C.coord.astype(np.float64),
+        resRef._O.coord.astype(np.float64),
+        C_OXT_length,
+    ).astype(COORD_DTYPE, copy=False)
+    OXT = _new_atom("OXT", OXT_coord, "OXT", "O")
 
     # modify last residue of the structure to contain the OXT atom
     resRef.add(OXT)
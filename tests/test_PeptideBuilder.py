@@ -162,3 +162,17 @@ def test_add_terminal_OXT():
     assert compare_to_reference(structure, "extended_OXT.pdb")
     # check that presence of OXT is tested
     assert not compare_to_reference(structure, "extended.pdb")
+
+
+def test_copy_then_extend():
+    """
+    Extending a copied structure must not touch the original
+    """
+    structure = PeptideBuilder.initialize_res("H")
+    PeptideBuilder.add_residue(structure, "H")
+
+    fork = structure.copy()
+    PeptideBuilder.add_residue(fork, "H")
+
+    assert len(list(structure[0]["A"])) == 2
+    assert len(list(fork[0]["A"])) == 3